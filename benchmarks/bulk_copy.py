@@ -0,0 +1,109 @@
+"""Row throughput of ``create_many`` against COPY-based ``bulk_io`` import and export.
+
+Creates a ``bench_bulk_items`` table in the configured database and loads ``--rows``
+generated rows three ways: ``BaseRepository.create_many``, ``import_records`` straight
+into the table, and ``import_records`` merged on ``sku`` through a staging table. It
+then exports the table to a temporary CSV file. Peak Python memory is reported for each
+run, showing that the COPY paths stay bounded by ``--batch-rows`` rather than the row
+count. The table is dropped at the end.
+
+Usage:
+    python benchmarks/bulk_copy.py --rows 200000 --batch-rows 20000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Awaitable, Callable, Iterator
+from decimal import Decimal
+from time import perf_counter
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import Numeric, String, text  # noqa: E402
+from sqlalchemy.orm import Mapped, mapped_column  # noqa: E402
+from src.core.db import bulk_io  # noqa: E402
+from src.core.db.connection import async_session, engine  # noqa: E402
+from src.core.models import BaseModel  # noqa: E402
+from src.core.repository.base import BaseRepository  # noqa: E402
+
+COLUMNS = ["sku", "title", "price"]
+
+
+class BulkItem(BaseModel):
+    __tablename__ = "bench_bulk_items"
+    sku: Mapped[str] = mapped_column(String(32), unique=True)
+    title: Mapped[str] = mapped_column(String(200))
+    price: Mapped[Decimal] = mapped_column(Numeric(10, 2))
+
+
+def generate(rows: int) -> Iterator[tuple[str, str, Decimal]]:
+    for i in range(rows):
+        yield f"SKU-{i:09d}", f"Item number {i}", Decimal(i % 10_000) / 100
+
+
+async def reset() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(BulkItem.__table__.drop, checkfirst=True)
+        await conn.run_sync(BulkItem.__table__.create)
+
+
+async def run(label: str, rows: int, action: Callable[[], Awaitable[Any]]) -> None:
+    tracemalloc.start()
+    start = perf_counter()
+    await action()
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {rows / elapsed:>12,.0f} rows/s {peak / 2**20:>10.1f} MiB peak")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    async def create_many() -> None:
+        rows = [dict(zip(COLUMNS, row, strict=True)) for row in generate(args.rows)]
+        async with async_session() as session:
+            await BaseRepository(BulkItem, session).create_many(rows)
+
+    async def copy_in(conflict_target: list[str] | None = None) -> None:
+        async with async_session() as session:
+            await bulk_io.import_records(
+                session,
+                BulkItem,
+                generate(args.rows),
+                columns=COLUMNS,
+                conflict_target=conflict_target,
+                batch_rows=args.batch_rows,
+            )
+
+    async def copy_out(path: str) -> None:
+        async with async_session() as session:
+            await bulk_io.export_model(session, BulkItem, path, columns=COLUMNS)
+
+    try:
+        await reset()
+        await run("create_many", args.rows, create_many)
+        await reset()
+        await run("import_records", args.rows, copy_in)
+        await run("import_records (merge)", args.rows, lambda: copy_in(["sku"]))
+        async with async_session() as session:
+            await session.execute(text(f"ANALYZE {BulkItem.__tablename__}"))
+        with tempfile.TemporaryDirectory() as directory:
+            await run("export_model", args.rows, lambda: copy_out(f"{directory}/items.csv"))
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(BulkItem.__table__.drop, checkfirst=True)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,244 @@
+"""Concurrent checkout load test for ``InventoryService`` against local Postgres.
+
+Creates a few products with ``--stock`` units each and fires ``--requests`` reservations
+of random carts (1-3 products, 1-``--max-qty`` units each) with ``--concurrency`` in
+flight. It then checks the invariants that make overselling impossible:
+
+- per product, ``available + reserved`` still equals the initial stock;
+- ``reserved`` equals the held reservation units and neither counter is negative;
+- the units granted to successful reservations never exceed the stock.
+
+Afterwards it confirms a tenth of the carts, moves the expiry of the remaining holds
+into the past and sweeps them, checking that exactly the unconfirmed units return to
+available stock.
+
+``--naive`` runs the same load through a read-then-write update instead, the
+``create_and_update`` pattern, to show the oversell the conditional UPDATE prevents.
+Only the rows the run creates are removed at the end.
+
+Usage:
+    DB_POOL_SIZE=50 python benchmarks/inventory_reservations.py --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+from time import perf_counter
+from uuid import uuid4
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import delete, func, select, update  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.core.db.connection import Base, async_session, engine  # noqa: E402
+from src.core.error.exceptions import OutOfStockException  # noqa: E402
+from src.modules.catalog.models import Category, Product  # noqa: E402
+from src.modules.inventory.models import HELD, Reservation, StockLevel  # noqa: E402
+from src.modules.inventory.services.reservation import InventoryService  # noqa: E402
+
+
+async def setup(run_id: str, products: int, stock: int) -> tuple[int, list[int]]:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_session() as session:
+        category = Category(name=f"bench {run_id}", slug=f"bench-{run_id}")
+        session.add(category)
+        await session.flush()
+        items = [
+            Product(
+                name=f"bench {index}",
+                sku=f"bench-{run_id}-{index}",
+                price=10,
+                category_id=category.id,
+            )
+            for index in range(products)
+        ]
+        session.add_all(items)
+        await session.flush()
+        session.add_all(StockLevel(product_id=item.id, available=stock) for item in items)
+        await session.commit()
+        return category.id, [item.id for item in items]
+
+
+async def teardown(category_id: int, product_ids: list[int]) -> None:
+    async with async_session() as session:
+        await session.execute(delete(Reservation).where(Reservation.product_id.in_(product_ids)))
+        await session.execute(delete(StockLevel).where(StockLevel.product_id.in_(product_ids)))
+        await session.execute(delete(Product).where(Product.id.in_(product_ids)))
+        await session.execute(delete(Category).where(Category.id == category_id))
+        await session.commit()
+
+
+async def reserve(reference: str, cart: dict[int, int]) -> bool:
+    async with async_session() as session:
+        try:
+            await InventoryService(session).reserve(reference, cart)
+        except OutOfStockException:
+            return False
+        return True
+
+
+async def reserve_naive(reference: str, cart: dict[int, int]) -> bool:  # noqa: ARG001
+    """Read the stock, check it in Python and write the difference back."""
+    async with async_session() as session:
+        for product_id, quantity in sorted(cart.items()):
+            available = await session.scalar(
+                select(StockLevel.available).where(StockLevel.product_id == product_id)
+            )
+            if available is None or available < quantity:
+                await session.rollback()
+                return False
+            await session.execute(
+                update(StockLevel)
+                .where(StockLevel.product_id == product_id)
+                .values(available=available - quantity, reserved=StockLevel.reserved + quantity)
+            )
+        await session.commit()
+        return True
+
+
+async def check(product_ids: list[int], stock: int, granted: dict[int, int]) -> list[str]:
+    problems = []
+    async with async_session() as session:
+        levels = (
+            await session.execute(
+                select(StockLevel.product_id, StockLevel.available, StockLevel.reserved).where(
+                    StockLevel.product_id.in_(product_ids)
+                )
+            )
+        ).all()
+        held = dict(
+            (
+                await session.execute(
+                    select(Reservation.product_id, func.sum(Reservation.quantity))
+                    .where(Reservation.product_id.in_(product_ids), Reservation.status == HELD)
+                    .group_by(Reservation.product_id)
+                )
+            ).all()
+        )
+    for product_id, available, reserved in levels:
+        if available < 0 or reserved < 0:
+            problems.append(f"product {product_id}: negative stock {available}/{reserved}")
+        if available + reserved != stock:
+            problems.append(f"product {product_id}: available + reserved = {available + reserved}")
+        if granted.get(product_id, 0) > stock:
+            problems.append(f"product {product_id}: oversold, {granted[product_id]} of {stock}")
+        if reserved != held.get(product_id, 0):
+            problems.append(
+                f"product {product_id}: reserved {reserved}, held {held.get(product_id, 0)}"
+            )
+    return problems
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stock", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    )
+    parser.add_argument("--max-qty", type=int, default=3)
+    parser.add_argument("--naive", action="store_true")
+    args = parser.parse_args()
+
+    run_id = uuid4().hex[:8]
+    category_id, product_ids = await setup(run_id, args.products, args.stock)
+    carts = [
+        {
+            product_id: random.randint(1, args.max_qty)
+            for product_id in random.sample(
+                product_ids, random.randint(1, min(3, len(product_ids)))
+            )
+        }
+        for _ in range(args.requests)
+    ]
+    action = reserve_naive if args.naive else reserve
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+
+    async def one(index: int, cart: dict[int, int]) -> bool:
+        async with semaphore:
+            start = perf_counter()
+            ok = await action(f"bench-{run_id}-{index}", cart)
+            latencies.append(perf_counter() - start)
+            return ok
+
+    try:
+        start = perf_counter()
+        results = await asyncio.gather(*(one(index, cart) for index, cart in enumerate(carts)))
+        elapsed = perf_counter() - start
+
+        granted: dict[int, int] = dict.fromkeys(product_ids, 0)
+        for ok, cart in zip(results, carts, strict=True):
+            for product_id, quantity in cart.items():
+                granted[product_id] += quantity if ok else 0
+        latencies.sort()
+        print(
+            f"{len(carts)} reservations in {elapsed:.2f}s ({len(carts) / elapsed:,.0f}/s), "
+            f"{sum(results)} accepted, {len(carts) - sum(results)} out of stock"
+        )
+        print(
+            f"latency p50 {statistics.median(latencies) * 1000:.1f} ms, "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms"
+        )
+        print(f"units granted {sum(granted.values())} of {args.stock * len(product_ids)} in stock")
+
+        problems = await check(product_ids, args.stock, granted)
+        if args.naive:
+            # No reservation rows are written in naive mode, so only the stock is checked
+            oversold = [problem for problem in problems if "oversold" in problem]
+            print(f"naive mode: {len(oversold)} of {len(product_ids)} products oversold")
+            for problem in oversold:
+                print(" ", problem)
+            return
+        if problems:
+            raise SystemExit("\n".join(problems))
+        print("invariants hold: nothing oversold")
+
+        accepted = [index for index, ok in enumerate(results) if ok]
+        confirmed = accepted[: len(accepted) // 10]
+        sold = dict.fromkeys(product_ids, 0)
+        async with async_session() as session:
+            service = InventoryService(session)
+            for index in confirmed:
+                for product_id, quantity in (
+                    await service.confirm(f"bench-{run_id}-{index}")
+                ).items():
+                    sold[product_id] += quantity
+        async with async_session() as session:
+            await session.execute(
+                update(Reservation)
+                .where(Reservation.product_id.in_(product_ids), Reservation.status == HELD)
+                .values(expires_at=func.now())
+            )
+            await session.commit()
+            start = perf_counter()
+            released = await InventoryService(session).sweep_expired()
+            sweep_seconds = perf_counter() - start
+            levels = (
+                await session.execute(
+                    select(StockLevel.product_id, StockLevel.available, StockLevel.reserved).where(
+                        StockLevel.product_id.in_(product_ids)
+                    )
+                )
+            ).all()
+        print(f"confirmed {len(confirmed)} carts; sweeper released {released} units", end=" ")
+        print(f"in {sweep_seconds:.2f}s")
+        for product_id, available, reserved in levels:
+            if reserved != 0 or available != args.stock - sold[product_id]:
+                raise SystemExit(
+                    f"product {product_id}: available {available}, reserved {reserved}"
+                )
+        print("after sweep: every unconfirmed unit is available again")
+    finally:
+        await teardown(category_id, product_ids)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
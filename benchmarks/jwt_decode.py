@@ -0,0 +1,65 @@
+"""Access-token decodes per second with the verified-token cache cold and warm.
+
+Asymmetric algorithms get a throwaway key pair, so no keys need to be configured.
+
+Usage:
+    python benchmarks/jwt_decode.py --algorithm HS256
+    python benchmarks/jwt_decode.py --algorithm EdDSA
+"""
+
+import argparse
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+def generate_private_key(algorithm: str) -> str:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+    key = ed25519.Ed25519PrivateKey.generate() if algorithm == "EdDSA" else None
+    if algorithm == "ES256":
+        key = ec.generate_private_key(ec.SECP256R1())
+    if key is None:
+        raise SystemExit(f"no key generator for {algorithm}")
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def bench(label: str, decode, token: str, iterations: int, before=None) -> None:  # noqa: ANN001
+    start = perf_counter()
+    for _ in range(iterations):
+        if before is not None:
+            before()
+        decode(token)
+    elapsed = perf_counter() - start
+    print(f"{label:<6} {iterations / elapsed:12,.0f} decodes/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--algorithm", default="HS256")
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    os.environ["JWT_ALGORITHM"] = args.algorithm
+    if not args.algorithm.startswith("HS"):
+        os.environ["JWT_PRIVATE_KEY"] = generate_private_key(args.algorithm)
+
+    from src.core.security.jwt_handler import JWTHandler
+    from src.modules.auth.schemas import AccessTokenPayload
+
+    token, _ = JWTHandler.encode("access", AccessTokenPayload(user_id="42"))
+    print(args.algorithm)
+    bench("cold", JWTHandler.decode, token, args.iterations, before=JWTHandler.cache.clear)
+    bench("warm", JWTHandler.decode, token, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
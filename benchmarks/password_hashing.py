@@ -0,0 +1,70 @@
+"""Login throughput and event-loop stall: bcrypt on the loop vs. offloaded.
+
+Runs ``--logins`` concurrent verifications while a ticker measures how late the event
+loop wakes up, which is what every other request on the worker would feel.
+
+Usage:
+    python benchmarks/password_hashing.py --logins 32 --rounds 12
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.security.password_handler import PasswordHandler  # noqa: E402
+
+
+async def ticker(stop: asyncio.Event, lags: list[float], interval: float = 0.01) -> None:
+    while not stop.is_set():
+        start = perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(perf_counter() - start - interval)
+
+
+async def blocking_login(password: str, hashed: str) -> bool:
+    return PasswordHandler.verify_password(password, hashed)
+
+
+async def run(label: str, login, logins: int, password: str, hashed: str) -> None:  # noqa: ANN001
+    stop = asyncio.Event()
+    lags: list[float] = []
+    tick = asyncio.create_task(ticker(stop, lags))
+    await asyncio.sleep(0)
+
+    start = perf_counter()
+    results = await asyncio.gather(*(login(password, hashed) for _ in range(logins)))
+    elapsed = perf_counter() - start
+    stop.set()
+    await tick
+
+    assert all(results)
+    lags.sort()
+    worst = lags[-1] if lags else elapsed
+    p99 = lags[int(len(lags) * 0.99)] if lags else elapsed
+    print(
+        f"{label:<10} {logins / elapsed:8.1f} logins/s  "
+        f"loop lag p99 {p99 * 1000:8.1f} ms  max {worst * 1000:8.1f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=PasswordHandler.rounds)
+    args = parser.parse_args()
+
+    PasswordHandler.rounds = args.rounds
+    password = "correct horse battery staple"
+    hashed = PasswordHandler.hash(password)
+
+    await run("on-loop", blocking_login, args.logins, password, hashed)
+    await run("offloaded", PasswordHandler.verify_password_async, args.logins, password, hashed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
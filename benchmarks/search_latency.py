@@ -0,0 +1,126 @@
+"""Search latency against table size for the ILIKE, full-text and trigram backends.
+
+Creates ``bench_search_*`` tables in the configured database, fills them with random
+product-like titles (one in a thousand carries a rare word), and times
+``paginate_filters`` searches for that word at each size. The tables
+are dropped at the end. The trigram backend is skipped when ``pg_trgm`` is unavailable.
+
+Usage:
+    python benchmarks/search_latency.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import String, text  # noqa: E402
+from sqlalchemy.exc import DBAPIError  # noqa: E402
+from sqlalchemy.orm import Mapped, mapped_column  # noqa: E402
+from src.core.db.connection import async_session, engine  # noqa: E402
+from src.core.models import BaseModel  # noqa: E402
+from src.core.repository.base import BaseRepository  # noqa: E402
+from src.core.repository.search import PostgresFullTextSearch, TrigramSearch  # noqa: E402
+from src.core.schemas.common import FilterOptions, QueryParams  # noqa: E402
+
+WORDS = [
+    *("red", "blue", "green", "black", "white", "leather", "cotton", "wool", "linen"),
+    *("running", "trail", "hiking", "summer", "winter", "rain", "jacket", "shoe", "boot"),
+    *("sock", "shirt", "dress", "bag", "wallet", "belt", "scarf", "hat", "glove"),
+]
+# One row in RARE_EVERY carries the rare word, so a search cannot stop after a few rows
+RARE_WORD = "aurora"
+RARE_EVERY = 1000
+
+
+class IlikeProduct(BaseModel):
+    __tablename__ = "bench_search_ilike"
+    title: Mapped[str] = mapped_column(String(200))
+
+
+class FullTextProduct(BaseModel):
+    __tablename__ = "bench_search_fts"
+    __search_backend__ = PostgresFullTextSearch(("title",), config="english")
+    title: Mapped[str] = mapped_column(String(200))
+
+
+class TrigramProduct(BaseModel):
+    __tablename__ = "bench_search_trgm"
+    __search_backend__ = TrigramSearch(("title",))
+    title: Mapped[str] = mapped_column(String(200))
+
+
+async def fill(model: type[BaseModel], size: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(model.__table__.drop, checkfirst=True)
+        await conn.run_sync(model.__table__.create)
+    rows = [
+        {
+            "title": " ".join(
+                [*random.choices(WORDS, k=4), *([RARE_WORD] if i % RARE_EVERY == 0 else [])]
+            )
+        }
+        for i in range(size)
+    ]
+    async with async_session() as session:
+        await BaseRepository(model, session).create_many(rows)
+        await session.execute(text(f"ANALYZE {model.__tablename__}"))
+        await session.commit()
+
+
+async def measure(model: type[BaseModel], term: str, repeat: int) -> float:
+    options = FilterOptions(
+        filters={},
+        search_fields=["title"],
+        pagination=QueryParams(page=1, page_size=20, search=term),
+        count_strategy="none",
+    )
+    timings = []
+    async with async_session() as session:
+        repository = BaseRepository(model, session)
+        await repository.paginate_filters(options)
+        for _ in range(repeat):
+            start = perf_counter()
+            await repository.paginate_filters(options)
+            timings.append(perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--term", default=RARE_WORD)
+    args = parser.parse_args()
+
+    models: list[type[BaseModel]] = [IlikeProduct, FullTextProduct, TrigramProduct]
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except DBAPIError:
+        print("pg_trgm is not available; skipping the trigram backend")
+        models.remove(TrigramProduct)
+
+    print(f"{'rows':>10} " + " ".join(f"{model.__name__:>18}" for model in models))
+    try:
+        for size in args.sizes:
+            latencies = []
+            for model in models:
+                await fill(model, size)
+                latencies.append(await measure(model, args.term, args.repeat))
+            print(f"{size:>10} " + " ".join(f"{latency:>15.2f} ms" for latency in latencies))
+    finally:
+        async with engine.begin() as conn:
+            for model in models:
+                await conn.run_sync(model.__table__.drop, checkfirst=True)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
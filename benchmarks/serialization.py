@@ -0,0 +1,157 @@
+"""Serialization cost of a paginated list endpoint at several page sizes.
+
+Compares, in-process through the ASGI interface:
+
+- ``encoder``: rows validated one by one into a ``PaginatedResponse`` returned without a
+  response model, so FastAPI walks it with ``jsonable_encoder``;
+- ``response_model``: ORM rows returned under ``response_model=PaginatedResponse[...]``;
+- ``paginated_response``: the one-pass helper from ``core.helpers.serialization``.
+
+Usage:
+    python benchmarks/serialization.py --sizes 10 100 1000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from datetime import UTC, datetime
+from decimal import Decimal
+from time import perf_counter
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi import FastAPI  # noqa: E402
+from pydantic import BaseModel, ConfigDict  # noqa: E402
+from sqlalchemy import Numeric, String  # noqa: E402
+from sqlalchemy.orm import Mapped, mapped_column  # noqa: E402
+from src.core.helpers.serialization import FastJSONResponse, paginated_response  # noqa: E402
+from src.core.models import BaseModel as ORMBaseModel  # noqa: E402
+from src.core.schemas.common import PaginatedResponse, PaginationMeta  # noqa: E402
+
+
+class Product(ORMBaseModel):
+    __tablename__ = "bench_serialization_products"
+    name: Mapped[str] = mapped_column(String(100))
+    sku: Mapped[str] = mapped_column(String(32))
+    description: Mapped[str] = mapped_column(String(500))
+    price: Mapped[Decimal] = mapped_column(Numeric(10, 2))
+    stock: Mapped[int]
+    active: Mapped[bool]
+
+
+class ProductSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    sku: str
+    description: str
+    price: Decimal
+    stock: int
+    active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+def make_rows(size: int) -> list[Product]:
+    now = datetime.now(UTC)
+    return [
+        Product(
+            id=index,
+            name=f"Product {index}",
+            sku=f"SKU-{index:08d}",
+            description="A reasonably long product description " * 3,
+            price=Decimal("19.99"),
+            stock=index % 50,
+            active=index % 3 != 0,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(size)
+    ]
+
+
+def build_app(rows: list[Product]) -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse)
+    meta = PaginationMeta(
+        total=len(rows) * 10,
+        current_page=1,
+        next_page=2,
+        prev_page=None,
+        last_page=10,
+        page_size=len(rows),
+    )
+
+    @app.get("/encoder", response_model=None)
+    async def encoder() -> Any:
+        return PaginatedResponse[ProductSchema](
+            data=[ProductSchema.model_validate(row) for row in rows], meta=meta
+        )
+
+    @app.get("/response-model", response_model=PaginatedResponse[ProductSchema])
+    async def response_model() -> Any:
+        return {"data": rows, "meta": meta}
+
+    @app.get("/fast", response_model=PaginatedResponse[ProductSchema])
+    async def fast() -> Any:
+        return paginated_response(rows, meta, ProductSchema)
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    size = 0
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return size
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    paths = ["/encoder", "/response-model", "/fast"]
+    print(f"{'page size':>10} " + " ".join(f"{path:>18}" for path in paths) + "   (ms/request)")
+    for size in args.sizes:
+        app = build_app(make_rows(size))
+        timings = []
+        for path in paths:
+            await call(app, path)
+            iterations = 0
+            start = perf_counter()
+            while perf_counter() - start < args.seconds:
+                await call(app, path)
+                iterations += 1
+            timings.append((perf_counter() - start) / iterations * 1000)
+        print(f"{size:>10} " + " ".join(f"{timing:>18.3f}" for timing in timings))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
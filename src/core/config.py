@@ -1,14 +1,81 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     APP_VERSION: str
     DEBUG: bool
+    # Browser origins allowed to call the API with credentials; CORS is off while empty
+    CORS_ORIGINS: list[str] = []
     DATABASE_URL: str
+    DATABASE_REPLICA_URLS: list[str] = []
+    DATABASE_REPLICA_STRATEGY: Literal["round_robin", "least_connections"] = "round_robin"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    # Transaction-pooling pgbouncer cannot keep named prepared statements across checkouts
+    DB_PGBOUNCER_MODE: bool = False
     SECRET_KEY: str
     JWT_ALGORITHM: str
     ACCESS_TOKEN_EXPIRY_MINUTES: int
     REFRESH_TOKEN_EXPIRY_MINUTES: int
+    # PEM text or a path to a PEM file; used instead of SECRET_KEY for EdDSA/ES*/RS* algorithms.
+    # Services that only verify tokens need just the public key.
+    JWT_PRIVATE_KEY: str | None = None
+    JWT_PUBLIC_KEY: str | None = None
+    JWT_CACHE_SIZE: int = 10_000
+
+    STATEMENT_CACHE_SIZE: int = 256
+    BULK_CHUNK_SIZE: int = 1000
+    # Most records bulk_io holds in memory at once while copying from an iterator
+    BULK_COPY_BATCH_ROWS: int = 50_000
+    # Rows per transaction for chunked update_obj/delete and the soft-delete purge
+    DB_WRITE_CHUNK_SIZE: int = 5000
+    # Seconds to sleep between chunks, giving replication and live traffic room
+    DB_WRITE_CHUNK_PAUSE: float = 0.0
+    SOFT_DELETE_RETENTION_DAYS: int = 30
+    # Seconds between purges of soft-deleted rows past retention; 0 disables the task
+    SOFT_DELETE_PURGE_INTERVAL: float = 0
+    INVENTORY_HOLD_SECONDS: int = 900
+    # Seconds between sweeps releasing expired reservation holds, e.g. 30 where inventory is
+    # in use; 0 disables the task
+    INVENTORY_SWEEP_INTERVAL: float = 0
+    INVENTORY_SWEEP_BATCH: int = 500
+    # Worker concurrency per job queue, overridable with ``python -m src.worker --queue``
+    JOB_QUEUES: dict[str, int] = {"default": 4}
+    # Modules imported by the worker so their @task handlers are registered
+    JOB_MODULES: list[str] = []
+    JOB_DEFAULT_MAX_ATTEMPTS: int = 5
+    # Retry backoff doubles from the base up to the max, in seconds, with jitter
+    JOB_RETRY_BASE_SECONDS: float = 5
+    JOB_RETRY_MAX_SECONDS: float = 3600
+    # Most jobs one queue claims per dequeue
+    JOB_BATCH_SIZE: int = 10
+    # Seconds a worker waits for a NOTIFY before polling, e.g. for jobs with a future run_at
+    JOB_POLL_INTERVAL: float = 5
+    # Seconds after which a running job is presumed lost with its worker and requeued
+    JOB_LOCK_TIMEOUT: float = 600
+    JOB_RETENTION_DAYS: int = 7
+    RESULT_CACHE_MAX_ENTRIES: int = 4096
+    # Mounts /internal/metrics on the public app, so it is off by default; set
+    # INTERNAL_METRICS_TOKEN too unless the route is unreachable from outside
+    INTERNAL_METRICS_ENABLED: bool = False
+    # Bearer token /internal/metrics requires when set
+    INTERNAL_METRICS_TOKEN: str | None = None
+    SERVER_TIMING_ENABLED: bool = True
+    DB_STRICT_LOADING: bool = True
+    # Merge concurrent get_by_id lookups of one request into a single IN query
+    DB_BATCH_LOADING: bool = True
+    # Development aid: log statements repeated more than the threshold within one request
+    N_PLUS_ONE_DETECTION: bool = False
+    N_PLUS_ONE_THRESHOLD: int = 5
+    BCRYPT_ROUNDS: int = 12
+    # bcrypt releases the GIL, so each worker thread can keep one core busy
+    PASSWORD_HASH_WORKERS: int = 2
 
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -1,9 +1,15 @@
 from .connection import Base, ModelType, get_db
-from .helpers import operators_map
+from .helpers import Explain, operators_map
+from .routing import pin_primary
+from .unit_of_work import in_unit_of_work, uow
 
 __all__ = [
     "get_db",
     "Base",
     "ModelType",
     "operators_map",
+    "Explain",
+    "uow",
+    "in_unit_of_work",
+    "pin_primary",
 ]
@@ -0,0 +1,331 @@
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from os import PathLike
+from time import perf_counter
+from typing import Any, BinaryIO, Literal
+from uuid import uuid4
+
+from sqlalchemy import JSON, Column, MetaData, Select, Table, func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.config import settings
+from src.core.logger import logger
+from src.core.repository.batch_loader import invalidate_batch_loader
+from src.core.repository.result_cache import result_cache
+
+from .unit_of_work import in_unit_of_work
+
+CopyFormat = Literal["csv", "binary"]
+# A path, an open binary file, or (for streaming) async chunks in / an async callback out
+CopySource = str | PathLike[str] | BinaryIO | AsyncIterable[bytes]
+CopyDestination = str | PathLike[str] | BinaryIO | Callable[[bytes], Awaitable[None]]
+Record = Sequence[Any] | dict[str, Any]
+
+
+@dataclass
+class CopyReport:
+    table: str
+    rows: int
+    seconds: float
+    batches: int = 1
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+async def _driver_connection(session: AsyncSession) -> Any:
+    """The asyncpg connection behind ``session``'s current transaction."""
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    return raw.driver_connection
+
+
+def _rowcount(status: str) -> int:
+    # asyncpg returns the command tag, e.g. "COPY 1000" or "INSERT 0 1000"
+    return int(status.rsplit(" ", 1)[-1])
+
+
+def _columns(model: type, columns: Sequence[str] | None) -> list[str]:
+    """``columns``, or by default every column the server does not fill in itself.
+
+    COPY applies server defaults only to columns left out of its column list, so
+    the primary key and ``server_default`` columns such as ``created_at`` are omitted.
+    """
+    table: Table = model.__table__  # type: ignore[attr-defined]
+    if columns is None:
+        return [
+            column.name
+            for column in table.columns
+            if not column.primary_key and column.server_default is None
+        ]
+    unknown = set(columns) - set(table.columns.keys())
+    if unknown:
+        raise ValueError(f"Unknown columns for {table.name}: {sorted(unknown)}")
+    return list(columns)
+
+
+async def _finish(session: AsyncSession, model: type, report: CopyReport) -> CopyReport:
+    if in_unit_of_work(session):
+        await session.flush()
+    else:
+        await session.commit()
+    invalidate_batch_loader(session, [model])
+    await result_cache.invalidate(model)
+    logger.info(
+        "Bulk import into %s: %d rows in %.2fs (%.0f rows/s)",
+        report.table,
+        report.rows,
+        report.seconds,
+        report.rows_per_second,
+    )
+    return report
+
+
+async def _create_stage(session: AsyncSession, table: Table, columns: list[str]) -> Table:
+    """Temporary table with just ``columns``; NOT NULL and defaults are left to the merge."""
+    name = f"_stage_{table.name}_{uuid4().hex[:8]}"
+    preparer = session.get_bind().dialect.identifier_preparer
+    selected = ", ".join(preparer.quote(column) for column in columns)
+    await session.execute(
+        text(
+            f"CREATE TEMPORARY TABLE {preparer.quote(name)} ON COMMIT DROP AS "
+            f"SELECT {selected} FROM {preparer.format_table(table)} WITH NO DATA"
+        )
+    )
+    return Table(name, MetaData(), *(Column(column, table.c[column].type) for column in columns))
+
+
+async def _merge(
+    session: AsyncSession,
+    model: type,
+    stage: Table,
+    columns: list[str],
+    conflict_target: Sequence[str],
+    update_fields: Sequence[str] | None,
+) -> int:
+    """Move staged rows into the model's table, updating rows that hit ``conflict_target``."""
+    table: Table = model.__table__  # type: ignore[attr-defined]
+    statement = pg_insert(table).from_select(columns, select(*(stage.c[name] for name in columns)))
+    fields = [name for name in (update_fields or columns) if name not in conflict_target]
+    if fields:
+        values: dict[str, Any] = {name: statement.excluded[name] for name in fields}
+        if "updated_at" in table.c and "updated_at" not in values:
+            values["updated_at"] = func.now()
+        statement = statement.on_conflict_do_update(index_elements=conflict_target, set_=values)
+    else:
+        statement = statement.on_conflict_do_nothing(index_elements=conflict_target)
+    result = await session.execute(statement)
+    preparer = session.get_bind().dialect.identifier_preparer
+    await session.execute(text(f"DROP TABLE {preparer.quote(stage.name)}"))
+    return int(result.rowcount)  # type: ignore[attr-defined]
+
+
+def _constant(value: Any) -> Any:
+    return value
+
+
+def _client_defaults(table: Table, columns: list[str]) -> dict[str, Callable[[], Any]]:
+    """Factories for the ORM-side ``default=`` of ``columns``, which COPY never applies."""
+    defaults: dict[str, Callable[[], Any]] = {}
+    for name in columns:
+        default: Any = table.c[name].default
+        if default is not None and default.is_callable:
+            # SQLAlchemy wraps callables to take the execution context, unused here
+            defaults[name] = partial(default.arg, None)
+        else:
+            defaults[name] = partial(_constant, default.arg if default is not None else None)
+    return defaults
+
+
+def _json_encoders(
+    session: AsyncSession, table: Table, columns: list[str]
+) -> dict[int, Callable[[Any], Any]]:
+    """Serializers of JSON columns by position; COPY skips SQLAlchemy's bind processing."""
+    dialect = session.get_bind().dialect
+    encoders: dict[int, Callable[[Any], Any]] = {}
+    for index, name in enumerate(columns):
+        column_type = table.c[name].type
+        processor = column_type.bind_processor(dialect)
+        if isinstance(column_type, JSON) and processor is not None:
+            encoders[index] = processor
+    return encoders
+
+
+async def _batches(
+    session: AsyncSession,
+    records: Iterable[Record] | AsyncIterable[Record],
+    table: Table,
+    columns: list[str],
+    batch_rows: int,
+) -> AsyncIterable[list[tuple[Any, ...]]]:
+    defaults = _client_defaults(table, columns)
+    encoders = _json_encoders(session, table, columns)
+
+    def as_tuple(record: Record) -> tuple[Any, ...]:
+        # Keys missing from a dict take the column's default, as an ORM insert would
+        if isinstance(record, dict):
+            values = [record[name] if name in record else defaults[name]() for name in columns]
+        else:
+            values = list(record)
+        for index, encode in encoders.items():
+            values[index] = encode(values[index])
+        return tuple(values)
+
+    if isinstance(records, AsyncIterable):
+        batch: list[tuple[Any, ...]] = []
+        async for record in records:
+            batch.append(as_tuple(record))
+            if len(batch) >= batch_rows:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        return
+
+    iterator = iter(records)
+    while batch := [as_tuple(record) for record in islice(iterator, batch_rows)]:
+        yield batch
+
+
+async def import_records(
+    session: AsyncSession,
+    model: type,
+    records: Iterable[Record] | AsyncIterable[Record],
+    columns: Sequence[str] | None = None,
+    conflict_target: Sequence[str] | None = None,
+    update_fields: Sequence[str] | None = None,
+    batch_rows: int | None = None,
+) -> CopyReport:
+    """COPY ``records`` (tuples in ``columns`` order, or dicts) into ``model``'s table.
+
+    ``columns`` defaults to every column but the primary key and those with a server
+    default, which the database then fills in. Keys missing from dict records take the
+    column's ORM ``default=``.
+
+    Records are pulled from the source ``batch_rows`` at a time
+    (``BULK_COPY_BATCH_ROWS``), which caps how many are held in memory however long the
+    source is. Without ``conflict_target`` rows are copied straight into the table;
+    with it they are staged in a temporary table and merged with
+    ``INSERT ... ON CONFLICT DO UPDATE`` of ``update_fields`` (default: all copied
+    columns).
+    """
+    table: Table = model.__table__  # type: ignore[attr-defined]
+    column_names = _columns(model, columns)
+    batch_rows = batch_rows or settings.BULK_COPY_BATCH_ROWS
+    start = perf_counter()
+
+    target = await _create_stage(session, table, column_names) if conflict_target else table
+    driver = await _driver_connection(session)
+    copied = batches = 0
+    async for batch in _batches(session, records, table, column_names, batch_rows):
+        status = await driver.copy_records_to_table(
+            target.name, records=batch, columns=column_names, schema_name=target.schema
+        )
+        copied += _rowcount(status)
+        batches += 1
+
+    rows = copied
+    if conflict_target:
+        rows = await _merge(session, model, target, column_names, conflict_target, update_fields)
+    report = CopyReport(table.name, rows, perf_counter() - start, batches)
+    return await _finish(session, model, report)
+
+
+async def import_file(
+    session: AsyncSession,
+    model: type,
+    source: CopySource,
+    columns: Sequence[str] | None = None,
+    format: CopyFormat = "csv",  # noqa: A002
+    header: bool = True,
+    conflict_target: Sequence[str] | None = None,
+    update_fields: Sequence[str] | None = None,
+) -> CopyReport:
+    """COPY a CSV or binary file into ``model``'s table, staging it when merging.
+
+    Without ``columns`` the file must hold the columns ``import_records`` defaults to.
+
+    ``source`` is streamed to the server in chunks, so its size is not bounded by memory;
+    an async iterable of ``bytes`` (e.g. an upload) works the same as a path.
+    """
+    table: Table = model.__table__  # type: ignore[attr-defined]
+    column_names = _columns(model, columns)
+    start = perf_counter()
+
+    target = await _create_stage(session, table, column_names) if conflict_target else table
+    driver = await _driver_connection(session)
+    status = await driver.copy_to_table(
+        target.name,
+        source=source,
+        columns=column_names,
+        schema_name=target.schema,
+        format=format,
+        header=header if format == "csv" else None,
+    )
+    rows = _rowcount(status)
+    if conflict_target:
+        rows = await _merge(session, model, target, column_names, conflict_target, update_fields)
+    report = CopyReport(table.name, rows, perf_counter() - start)
+    return await _finish(session, model, report)
+
+
+async def export_query(
+    session: AsyncSession,
+    statement: Select[Any],
+    destination: CopyDestination,
+    format: CopyFormat = "csv",  # noqa: A002
+    header: bool = True,
+) -> CopyReport:
+    """Stream the result of ``statement`` to ``destination`` with ``COPY (query) TO STDOUT``.
+
+    Rows go from the server to the destination chunk by chunk and are never collected,
+    so exports of any size run in constant memory.
+    """
+    compiled = statement.compile(
+        dialect=session.get_bind().dialect, compile_kwargs={"render_postcompile": True}
+    )
+    args = [compiled.params[name] for name in compiled.positiontup or ()]
+    start = perf_counter()
+    driver = await _driver_connection(session)
+    status = await driver.copy_from_query(
+        str(compiled),
+        *args,
+        output=destination,
+        format=format,
+        header=header if format == "csv" else None,
+    )
+    froms = statement.get_final_froms()
+    report = CopyReport(
+        getattr(froms[0], "name", "query") if froms else "query",
+        _rowcount(status),
+        perf_counter() - start,
+    )
+    logger.info(
+        "Bulk export from %s: %d rows in %.2fs (%.0f rows/s)",
+        report.table,
+        report.rows,
+        report.seconds,
+        report.rows_per_second,
+    )
+    return report
+
+
+async def export_model(
+    session: AsyncSession,
+    model: type,
+    destination: CopyDestination,
+    columns: Sequence[str] | None = None,
+    where: Any = None,
+    format: CopyFormat = "csv",  # noqa: A002
+    header: bool = True,
+) -> CopyReport:
+    """Export ``columns`` (default: all) of ``model``'s rows matching ``where``."""
+    table: Table = model.__table__  # type: ignore[attr-defined]
+    selected = [table.c[name] for name in columns] if columns else list(table.columns)
+    statement = select(*selected)
+    if where is not None:
+        statement = statement.where(where)
+    return await export_query(session, statement, destination, format=format, header=header)
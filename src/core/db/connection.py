@@ -1,14 +1,65 @@
 from collections.abc import AsyncGenerator
-from typing import TypeVar
+from typing import Any, TypeVar
+from uuid import uuid4
 
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 from src.core.config import settings
 
+from .pool_metrics import InstrumentedQueuePool, instrument_engine
+from .query_stats import instrument_queries
+from .routing import ReplicaSelector, RoutingSession
+
 DATABASE_URL = settings.DATABASE_URL
 
-engine = create_async_engine(DATABASE_URL, echo=settings.DEBUG)
-async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+def engine_options(url: str) -> dict[str, Any]:
+    """Pool and driver options for ``create_async_engine`` built from settings."""
+    options: dict[str, Any] = {
+        "echo": settings.DEBUG,
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if make_url(url).get_driver_name() == "asyncpg":
+        if settings.DB_PGBOUNCER_MODE:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        else:
+            options["connect_args"] = {
+                "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+            }
+    return options
+
+
+engine = create_async_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+instrument_engine(engine, "primary")
+instrument_queries(engine)
+replica_engines = [
+    create_async_engine(url, **engine_options(url)) for url in settings.DATABASE_REPLICA_URLS
+]
+for index, replica_engine in enumerate(replica_engines):
+    instrument_engine(replica_engine, f"replica_{index}")
+    instrument_queries(replica_engine)
+replica_selector = (
+    ReplicaSelector(replica_engines, settings.DATABASE_REPLICA_STRATEGY)
+    if replica_engines
+    else None
+)
+async_session = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    replicas=replica_selector,
+)
 
 
 class Base(DeclarativeBase):
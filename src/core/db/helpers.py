@@ -1,6 +1,10 @@
 from typing import Any
 
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import operators
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.sql.visitors import InternalTraversal
 
 operators_map: dict[str, Any] = {
     # "isnull": lambda c, v: (c is None) if v else (c is not None),
@@ -17,8 +21,23 @@ operators_map: dict[str, Any] = {
     "like": operators.like_op,
     "ilike": operators.ilike_op,
     "startswith": operators.startswith_op,
-    "istartswith": lambda c, v: c.ilike(v + "%"),
+    "istartswith": operators.istartswith_op,
     "endswith": operators.endswith_op,
-    "iendswith": lambda c, v: c.ilike("%" + v),
+    "iendswith": operators.iendswith_op,
     "overlaps": lambda c, v: c.overlaps(v),
 }
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` wrapper that keeps the wrapped statement's bind parameters."""
+
+    inherit_cache = True
+    _traverse_internals = [("statement", InternalTraversal.dp_clauseelement)]
+
+    def __init__(self, statement: Any) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
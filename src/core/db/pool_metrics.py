@@ -0,0 +1,104 @@
+from time import perf_counter
+from typing import Any, cast
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool, PoolProxiedConnection
+from src.core.helpers.metrics import Histogram
+
+
+class PoolMetrics:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.checkout_wait = Histogram()
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.peak_in_use = 0
+
+    def snapshot(self, pool: Pool) -> dict[str, Any]:
+        stats: dict[str, Any] = {
+            "checkouts": self.checkouts,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "peak_in_use": self.peak_in_use,
+            "checkout_wait_seconds": self.checkout_wait.snapshot(),
+        }
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            stats.update(
+                size=pool.size(),
+                in_use=pool.checkedout(),
+                idle=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                max_overflow=pool._max_overflow,
+            )
+        return stats
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited and how often it timed out.
+
+    SQLAlchemy has no event before a checkout starts waiting, so the wait is measured
+    around ``_do_get``; everything else comes from pool events in ``instrument_engine``.
+    """
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        if self.metrics is None:
+            return super()._do_get()
+
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.checkout_wait.observe(perf_counter() - start)
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        # QueuePool.recreate builds the new pool from self.__class__
+        pool = cast(InstrumentedQueuePool, super().recreate())
+        pool.metrics = self.metrics
+        return pool
+
+
+_engines: dict[str, tuple[AsyncEngine, PoolMetrics]] = {}
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> PoolMetrics:
+    """Attach pool metrics to ``engine`` and register it for :func:`pool_stats`."""
+    metrics = PoolMetrics(name)
+    sync_engine = engine.sync_engine
+    if isinstance(sync_engine.pool, InstrumentedQueuePool):
+        sync_engine.pool.metrics = metrics
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(*_: Any) -> None:
+        metrics.connects += 1
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(
+        _dbapi: Any, _record: ConnectionPoolEntry, _proxy: PoolProxiedConnection
+    ) -> None:
+        metrics.checkouts += 1
+        pool = sync_engine.pool
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            metrics.peak_in_use = max(metrics.peak_in_use, pool.checkedout())
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(*_: Any) -> None:
+        metrics.invalidations += 1
+
+    _engines[name] = (engine, metrics)
+    return metrics
+
+
+def pool_stats() -> dict[str, dict[str, Any]]:
+    return {
+        name: metrics.snapshot(engine.sync_engine.pool)
+        for name, (engine, metrics) in _engines.items()
+    }
@@ -0,0 +1,104 @@
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from src.core.config import settings
+
+_START_KEY = "query_stats_start"
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    # Executions per SQL string; only kept when repeated-query detection is on
+    statements: Counter[str] | None = None
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Statements executed more than ``threshold`` times, the usual sign of N+1 loads."""
+        if self.statements is None:
+            return {}
+        return {sql: count for sql, count in self.statements.items() if count > threshold}
+
+
+class RepeatedQueryError(AssertionError):
+    def __init__(self, repeated: dict[str, int]) -> None:
+        self.repeated = repeated
+        details = "\n".join(f"{count}x {sql}" for sql, count in repeated.items())
+        super().__init__(f"Repeated queries detected:\n{details}")
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats(
+    track_statements: bool = False,
+) -> tuple[QueryStats, Token[QueryStats | None]]:
+    """Count statements run in the current context (usually one request) from now on."""
+    stats = QueryStats(statements=Counter() if track_statements else None)
+    return stats, _current_stats.set(stats)
+
+
+def stop_query_stats(token: Token[QueryStats | None]) -> None:
+    _current_stats.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_stats.get()
+
+
+@contextmanager
+def detect_repeated_queries(
+    threshold: int = settings.N_PLUS_ONE_THRESHOLD,
+) -> Iterator[QueryStats]:
+    """Fail if any statement inside the block runs more than ``threshold`` times.
+
+    Meant for tests, to catch N+1 regressions in CI:
+
+    Example:
+        with detect_repeated_queries(threshold=1):
+            orders = await repository.filter(filter_options)
+            [order.items for order in orders]
+
+    Raises:
+        RepeatedQueryError: Listing the offending statements and their counts.
+    """
+    stats, token = start_query_stats(track_statements=True)
+    try:
+        yield stats
+    finally:
+        stop_query_stats(token)
+    repeated = stats.repeated(threshold)
+    if repeated:
+        raise RepeatedQueryError(repeated)
+
+
+def instrument_queries(engine: AsyncEngine) -> None:
+    """Add each statement's count and wall time on ``engine`` to the current stats.
+
+    Statements outside a tracked context cost one context variable lookup.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn: Connection, *_: Any) -> None:
+        if _current_stats.get() is not None:
+            conn.info[_START_KEY] = perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn: Connection, _cursor: Any, statement: str, *_: Any) -> None:
+        stats = _current_stats.get()
+        start = conn.info.pop(_START_KEY, None)
+        if stats is None or start is None:
+            return
+        stats.count += 1
+        stats.duration += perf_counter() - start
+        if stats.statements is not None:
+            stats.statements[statement] += 1
@@ -0,0 +1,64 @@
+from collections.abc import Sequence
+from itertools import count
+from typing import Any, Literal
+
+from sqlalchemy import Delete, Engine, Insert, Select, Update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+PIN_PRIMARY_KEY = "pin_primary"
+
+
+class ReplicaSelector:
+    """Pick a read replica per statement, by round robin or fewest checked-out connections."""
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        strategy: Literal["round_robin", "least_connections"] = "round_robin",
+    ) -> None:
+        self.engines = [engine.sync_engine for engine in engines]
+        self.strategy = strategy
+        self._counter = count()
+
+    def choose(self) -> Engine:
+        start = next(self._counter) % len(self.engines)
+        if self.strategy == "round_robin":
+            return self.engines[start]
+        # Rotate first so ties (e.g. pools without checkout tracking) still spread evenly
+        rotated = self.engines[start:] + self.engines[:start]
+        return min(rotated, key=lambda engine: getattr(engine.pool, "checkedout", lambda: 0)())
+
+
+class RoutingSession(Session):
+    """Session that sends plain SELECTs to replicas and everything else to the primary.
+
+    The first write (or ``SELECT ... FOR UPDATE``) pins the session to the primary, so
+    reads later in the same request see their own writes despite replication lag.
+    """
+
+    def __init__(self, *args: Any, replicas: ReplicaSelector | None = None, **kw: Any) -> None:
+        super().__init__(*args, **kw)
+        self.replicas = replicas
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Engine:
+        primary = super().get_bind(mapper=mapper, clause=clause, **kw)
+        if self.replicas is None or self.info.get(PIN_PRIMARY_KEY):
+            return primary  # type: ignore[return-value]
+
+        if (
+            self._flushing
+            or isinstance(clause, Insert | Update | Delete)
+            or (isinstance(clause, Select) and clause._for_update_arg is not None)
+        ):
+            self.info[PIN_PRIMARY_KEY] = True
+            return primary  # type: ignore[return-value]
+
+        if isinstance(clause, Select):
+            return self.replicas.choose()
+        return primary  # type: ignore[return-value]
+
+
+def pin_primary(session: AsyncSession) -> None:
+    """Send every further statement of ``session`` to the primary."""
+    session.info[PIN_PRIMARY_KEY] = True
@@ -0,0 +1,40 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+UOW_DEPTH_KEY = "unit_of_work_depth"
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    return bool(session.info.get(UOW_DEPTH_KEY))
+
+
+@asynccontextmanager
+async def uow(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """Group repository writes on ``session`` into a single transaction.
+
+    Inside the block ``BaseRepository`` writes only flush; the outermost block commits
+    once on success and rolls back on error. Nested blocks join the outer one.
+
+    In a route, open the block inside the handler (or the service it calls) on the
+    ``get_db`` session, so the commit finishes and can fail before the response is sent.
+    Teardown code of a ``yield`` dependency runs only after the response went out.
+
+    Example:
+        async with uow(session):
+            await orders.create(order)
+            await stock.update_obj({"id": item_id}, {"quantity": quantity - 1})
+    """
+    depth = session.info.get(UOW_DEPTH_KEY, 0)
+    session.info[UOW_DEPTH_KEY] = depth + 1
+    try:
+        yield session
+        if depth == 0:
+            await session.commit()
+    except Exception:
+        if depth == 0:
+            await session.rollback()
+        raise
+    finally:
+        session.info[UOW_DEPTH_KEY] = depth
@@ -7,5 +7,8 @@ UNAUTHORIZED_ERROR = "40006"
 INVALID_CRED = "40007"
 NOT_AUTHORIZED = "40008"
 EMAIL_ALREADY_EXISTS = "40009"
+INVALID_QUERY = "40010"
+OUT_OF_STOCK = "40011"
+RESERVATION_EXPIRED = "40012"
 INTERNAL_ERROR = "50001"
 DATABASE_ERROR = "50002"
@@ -9,7 +9,9 @@ from src.core.error.codes import (
     INVALID_CRED,
     INVALID_USER,
     NO_DATA,
+    OUT_OF_STOCK,
     REGISTRATION_FAILED,
+    RESERVATION_EXPIRED,
     UNAUTHORIZED_ERROR,
     USER_EXISTS,
 )
@@ -82,6 +84,18 @@ class InvalidUserException(CustomException):
     message: str = ERROR_MAPPER.get(INVALID_USER) or "Invalid user"
 
 
+class OutOfStockException(CustomException):
+    code = status.HTTP_409_CONFLICT
+    error_code = OUT_OF_STOCK
+    message: str = ERROR_MAPPER.get(OUT_OF_STOCK) or "Not enough stock"
+
+
+class ReservationExpiredException(CustomException):
+    code = status.HTTP_409_CONFLICT
+    error_code = RESERVATION_EXPIRED
+    message: str = ERROR_MAPPER.get(RESERVATION_EXPIRED) or "Reservation has expired"
+
+
 class InternalServerException(CustomException):
     code = status.HTTP_500_INTERNAL_SERVER_ERROR
     error_code = INTERNAL_ERROR
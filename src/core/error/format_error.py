@@ -3,10 +3,13 @@ from src.core.error.codes import (
     FORBIDDEN_ERROR,
     INTERNAL_ERROR,
     INVALID_CRED,
+    INVALID_QUERY,
     INVALID_USER,
     NO_DATA,
     NOT_AUTHORIZED,
+    OUT_OF_STOCK,
     REGISTRATION_FAILED,
+    RESERVATION_EXPIRED,
     UNAUTHORIZED_ERROR,
     USER_EXISTS,
 )
@@ -22,6 +25,9 @@ ERROR_MAPPER = {
     NOT_AUTHORIZED: "You are not authorized to perform this action",
     EMAIL_ALREADY_EXISTS: "Email already in use",
     REGISTRATION_FAILED: "Validation failed",
+    INVALID_QUERY: "Invalid query parameters",
+    OUT_OF_STOCK: "Not enough stock",
+    RESERVATION_EXPIRED: "Reservation has expired or was already settled",
 }
 
 
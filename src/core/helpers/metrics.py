@@ -0,0 +1,90 @@
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any
+
+# Seconds; fine-grained at the low end where pool waits and queries usually land
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus-style cumulative ``le`` buckets."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        result = []
+        running = 0
+        for bound, bucket_count in zip((*self.buckets, "+Inf"), self.counts, strict=True):
+            running += bucket_count
+            result.append((str(bound), running))
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"buckets": dict(self.cumulative()), "count": self.count, "sum": self.sum}
+
+
+def _format_labels(labels: dict[str, str] | None) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+class PrometheusText:
+    """Builder for the Prometheus text exposition format.
+
+    Samples are grouped under their metric name however they are added, so callers can
+    walk their data in whatever order is convenient.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, tuple[str, str, list[str]]] = {}
+
+    def _samples(self, name: str, kind: str, help_text: str) -> list[str]:
+        if name not in self._metrics:
+            self._metrics[name] = (kind, help_text, [])
+        return self._metrics[name][2]
+
+    def add(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        value: float,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        self._samples(name, kind, help_text).append(f"{name}{_format_labels(labels)} {value}")
+
+    def add_histogram(
+        self,
+        name: str,
+        help_text: str,
+        histogram: Histogram,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        samples = self._samples(name, "histogram", help_text)
+        labels = labels or {}
+        for bound, count in histogram.cumulative():
+            samples.append(f"{name}_bucket{_format_labels({**labels, 'le': bound})} {count}")
+        samples.append(f"{name}_sum{_format_labels(labels)} {histogram.sum}")
+        samples.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+    def render(self) -> str:
+        lines = []
+        for name, (kind, help_text, samples) in self._metrics.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
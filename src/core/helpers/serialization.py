@@ -0,0 +1,108 @@
+import json
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter, create_model
+from src.core.error.codes import INVALID_QUERY
+from src.core.error.exceptions import ValidationException
+from src.core.schemas.common import PaginatedResponse, PaginationMeta
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def json_dumps(content: Any) -> bytes:
+    """Encode ``content`` as compact UTF-8 JSON, using orjson when it is installed.
+
+    Values JSON cannot represent natively (datetimes, decimals, UUIDs) fall back to
+    ``str``.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=str)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=str).encode(
+        "utf-8"
+    )
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with :func:`json_dumps`; the app's default response class."""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+
+@lru_cache(maxsize=256)
+def type_adapter(tp: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(tp)
+
+
+@lru_cache(maxsize=256)
+def _partial_schema(schema: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    definitions: dict[str, Any] = {
+        name: (info.annotation, info)
+        for name, info in schema.model_fields.items()
+        if name in fields or name == "id"
+    }
+    return create_model(f"{schema.__name__}Fields", __config__=schema.model_config, **definitions)
+
+
+def partial_schema(schema: type[BaseModel], fields: Sequence[str] | None) -> type[BaseModel]:
+    """``schema`` narrowed to ``fields`` (and ``id``), for responses to ``?fields=`` requests.
+
+    Rows loaded with a projection raise on the attributes left out, so they must be
+    serialized without reading them.
+
+    Raises:
+        ValidationException: If a field is not part of ``schema``.
+    """
+    if not fields:
+        return schema
+    unknown = [name for name in fields if name not in schema.model_fields]
+    if unknown:
+        raise ValidationException(
+            errors=dict.fromkeys(unknown, f"Unknown field for {schema.__name__}"),
+            error_code=INVALID_QUERY,
+        )
+    return _partial_schema(schema, frozenset(fields))
+
+
+def dump_json(content: Any, tp: Any) -> bytes:
+    """Validate ``content`` against ``tp`` and encode it to JSON bytes.
+
+    ORM objects are read through their attributes, and both steps run in pydantic-core,
+    so no intermediate dicts are built in Python.
+    """
+    adapter = type_adapter(tp)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def json_response(content: Any, tp: Any, status_code: int = 200) -> Response:
+    """Build a JSON response for ``content`` shaped as ``tp``, e.g. ``list[ProductSchema]``.
+
+    Returning a ``Response`` skips FastAPI's own response validation and encoding, so
+    declare the schema through ``response_model`` on the route for the OpenAPI docs.
+    """
+    return Response(dump_json(content, tp), status_code=status_code, media_type="application/json")
+
+
+def paginated_response(
+    rows: Sequence[Any],
+    meta: PaginationMeta,
+    schema: type[BaseModel],
+    status_code: int = 200,
+) -> Response:
+    """Serialize a ``paginate_filters`` result as ``PaginatedResponse[schema]`` in one pass.
+
+    Example:
+        rows, meta = await repository.paginate_filters(filter_options)
+        return paginated_response(rows, meta, ProductSchema)
+    """
+    return json_response(
+        {"data": rows, "meta": meta},
+        PaginatedResponse[schema],  # type: ignore[valid-type]
+        status_code,
+    )
@@ -0,0 +1,36 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def ndjson_response(
+    items: AsyncIterable[Any],
+    schema: type[BaseModel],
+    flush_size: int = 64 * 1024,
+) -> StreamingResponse:
+    """Stream ``items`` as newline-delimited JSON, one ``schema`` document per line.
+
+    Lines are sent in chunks of about ``flush_size`` bytes as they are produced, so
+    neither the rows nor the body are ever held in memory as a whole. Pair it with
+    ``BaseRepository.stream``:
+
+    Example:
+        return ndjson_response(repository.stream(filter_options), ProductSchema)
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        buffer = bytearray()
+        async for item in items:
+            buffer += schema.model_validate(item, from_attributes=True).model_dump_json().encode()
+            buffer += b"\n"
+            if len(buffer) >= flush_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,17 @@
+from .models import FAILED, QUEUED, RUNNING, SUCCEEDED, Job
+from .repository import JobRepository
+from .tasks import Task, get_task, task
+from .worker import Worker
+
+__all__ = [
+    "Job",
+    "JobRepository",
+    "QUEUED",
+    "RUNNING",
+    "SUCCEEDED",
+    "FAILED",
+    "Task",
+    "task",
+    "get_task",
+    "Worker",
+]
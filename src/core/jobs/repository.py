@@ -0,0 +1,151 @@
+import random
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Integer, and_, bindparam, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.config import settings
+from src.core.repository.base import BaseRepository
+
+from .models import FAILED, QUEUED, RUNNING, SUCCEEDED, Job
+
+NOTIFY_CHANNEL = "jobs"
+# Claims and settlements are conditional UPDATEs; the identity map is refreshed by RETURNING
+NO_SYNC = {"synchronize_session": False}
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with full jitter for a job that failed ``attempts`` times."""
+    ceiling = min(
+        settings.JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.JOB_RETRY_MAX_SECONDS
+    )
+    return random.uniform(ceiling / 2, ceiling)
+
+
+class JobRepository(BaseRepository[Job]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(Job, session)
+
+    async def enqueue(
+        self,
+        task: str,
+        payload: dict[str, Any],
+        queue: str,
+        max_attempts: int,
+        run_at: datetime | None = None,
+        priority: int = 0,
+    ) -> Job:
+        """Insert a job and ``NOTIFY`` its queue.
+
+        Notifications are delivered on commit, so inside a unit of work workers wake only
+        once the job, and whatever the request wrote with it, is committed.
+        """
+        job = Job(
+            task=task,
+            payload=payload,
+            queue=queue,
+            max_attempts=max_attempts,
+            priority=priority,
+            status=QUEUED,
+        )
+        if run_at is not None:
+            job.run_at = run_at
+        self.session.add(job)
+        await self.session.execute(select(func.pg_notify(NOTIFY_CHANNEL, queue)))
+        await self._commit()
+        await self._invalidate([job.id])
+        return job
+
+    async def dequeue(self, queue: str, limit: int, worker_id: str) -> Sequence[Job]:
+        """Claim up to ``limit`` due jobs of ``queue`` for ``worker_id`` and commit at once.
+
+        ``FOR UPDATE SKIP LOCKED`` makes concurrent workers claim disjoint batches instead
+        of queueing behind each other's row locks. Jobs run outside the claiming
+        transaction; one abandoned by a dead worker is requeued by ``requeue_stale``.
+        """
+        statement = self._cached(
+            ("dequeue",),
+            lambda: (
+                update(Job)
+                .where(
+                    Job.id.in_(
+                        select(Job.id)
+                        .where(
+                            Job.queue == bindparam("queue_name"),
+                            Job.status == QUEUED,
+                            Job.run_at <= func.now(),
+                        )
+                        .order_by(Job.priority, Job.run_at, Job.id)
+                        .limit(bindparam("batch", type_=Integer))
+                        .with_for_update(skip_locked=True)
+                    )
+                )
+                .values(
+                    status=RUNNING,
+                    attempts=Job.attempts + 1,
+                    locked_at=func.now(),
+                    locked_by=bindparam("worker"),
+                )
+                .returning(Job)
+                .execution_options(populate_existing=True)
+            ),
+        )
+        params = {"queue_name": queue, "batch": limit, "worker": worker_id}
+        jobs = (await self.session.scalars(statement, params, execution_options=NO_SYNC)).all()
+        await self.session.commit()
+        return jobs
+
+    async def succeed(self, job: Job) -> None:
+        await self._settle(job, SUCCEEDED)
+
+    async def fail(self, job: Job, error: str) -> float | None:
+        """Record a failed attempt.
+
+        Returns:
+            float | None: Seconds until the retry, or ``None`` if attempts are used up.
+        """
+        if job.attempts >= job.max_attempts:
+            await self._settle(job, FAILED, last_error=error)
+            return None
+        delay = retry_delay(job.attempts)
+        await self._settle(
+            job, QUEUED, last_error=error, run_at=func.now() + timedelta(seconds=delay)
+        )
+        return delay
+
+    async def _settle(self, job: Job, status: str, **values: Any) -> None:
+        # Only the claim this worker still holds may be settled; a requeued job is not ours
+        statement = (
+            update(Job)
+            .where(Job.id == job.id, Job.status == RUNNING, Job.locked_by == job.locked_by)
+            .values(status=status, locked_at=None, locked_by=None, **values)
+        )
+        await self.session.execute(statement, execution_options=NO_SYNC)
+        await self.session.commit()
+
+    async def requeue_stale(self, timeout: float) -> int:
+        """Put back jobs whose worker has held them for more than ``timeout`` seconds."""
+        statement = (
+            update(Job)
+            .where(Job.status == RUNNING, Job.locked_at < func.now() - timedelta(seconds=timeout))
+            .values(status=QUEUED, locked_at=None, locked_by=None, last_error="Worker lost")
+            .returning(Job.id)
+        )
+        requeued = (await self.session.scalars(statement, execution_options=NO_SYNC)).all()
+        await self.session.commit()
+        return len(requeued)
+
+    async def purge_finished(self, retention: timedelta | None = None) -> int:
+        """Delete jobs that succeeded more than ``retention`` ago; failed ones are kept.
+
+        ``retention`` defaults to ``JOB_RETENTION_DAYS``.
+        """
+        if retention is None:
+            retention = timedelta(days=settings.JOB_RETENTION_DAYS)
+        return await self._write_in_chunks(
+            delete(Job),
+            and_(Job.status == SUCCEEDED, Job.updated_at < func.now() - retention),
+            settings.DB_WRITE_CHUNK_SIZE,
+            None,
+        )
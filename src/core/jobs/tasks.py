@@ -0,0 +1,76 @@
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.config import settings
+
+from .models import Job
+from .repository import JobRepository
+
+Handler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class Task:
+    """A registered job handler and the defaults its jobs are enqueued with."""
+
+    name: str
+    handler: Handler
+    queue: str = "default"
+    max_attempts: int | None = None
+    # Seconds before a running job is cancelled and retried
+    timeout: float | None = None
+
+    async def __call__(self, payload: dict[str, Any]) -> None:
+        await self.handler(payload)
+
+    async def enqueue(
+        self,
+        session: AsyncSession,
+        payload: dict[str, Any] | None = None,
+        run_at: datetime | None = None,
+        priority: int = 0,
+    ) -> Job:
+        """Add a job for this task; it becomes visible to workers when ``session`` commits."""
+        return await JobRepository(session).enqueue(
+            self.name,
+            payload or {},
+            queue=self.queue,
+            max_attempts=self.max_attempts or settings.JOB_DEFAULT_MAX_ATTEMPTS,
+            run_at=run_at,
+            priority=priority,
+        )
+
+
+_registry: dict[str, Task] = {}
+
+
+def task(
+    name: str | None = None,
+    queue: str = "default",
+    max_attempts: int | None = None,
+    timeout: float | None = None,
+) -> Callable[[Handler], Task]:
+    """Register an async ``handler(payload)`` as a job task.
+
+    Example:
+        @task(queue="emails", max_attempts=8)
+        async def send_welcome_email(payload: dict[str, Any]) -> None: ...
+
+        await send_welcome_email.enqueue(session, {"user_id": user.id})
+    """
+
+    def register(handler: Handler) -> Task:
+        registered = Task(name or handler.__qualname__, handler, queue, max_attempts, timeout)
+        if registered.name in _registry:
+            raise ValueError(f"Job task {registered.name} is already registered")
+        _registry[registered.name] = registered
+        return registered
+
+    return register
+
+
+def get_task(name: str) -> Task | None:
+    return _registry.get(name)
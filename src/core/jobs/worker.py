@@ -0,0 +1,159 @@
+import asyncio
+import contextlib
+import os
+import socket
+import traceback
+from collections.abc import Callable
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from src.core.config import settings
+from src.core.db.connection import async_session, engine
+from src.core.logger import logger
+
+from .models import Job
+from .repository import NOTIFY_CHANNEL, JobRepository
+from .tasks import get_task
+
+
+class Worker:
+    """Run jobs of several queues, each with its own number of concurrent jobs.
+
+    Every queue has a dispatcher that claims as many due jobs as it has free slots, up to
+    ``batch_size`` per dequeue, and runs each in its own asyncio task. Dispatchers sleep
+    until a ``NOTIFY`` for their queue arrives on a dedicated ``LISTEN`` connection, or
+    ``poll_interval`` passes, which picks up jobs enqueued with a later ``run_at``. A failed
+    job's retry wakes its queue once it is due.
+
+    Args:
+        queues (dict[str, int] | None): Concurrency per queue; defaults to ``JOB_QUEUES``.
+        batch_size (int | None): Most jobs claimed at once; defaults to ``JOB_BATCH_SIZE``.
+        poll_interval (float | None): Seconds to wait for a notification before polling;
+            defaults to ``JOB_POLL_INTERVAL``.
+    """
+
+    def __init__(
+        self,
+        queues: dict[str, int] | None = None,
+        batch_size: int | None = None,
+        poll_interval: float | None = None,
+        session_factory: Callable[[], AsyncSession] = async_session,
+        bind: AsyncEngine = engine,
+    ):
+        self.queues = queues or settings.JOB_QUEUES
+        self.batch_size = batch_size or settings.JOB_BATCH_SIZE
+        self.poll_interval = poll_interval or settings.JOB_POLL_INTERVAL
+        self.session_factory = session_factory
+        self.bind = bind
+        self.id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._wake = {queue: asyncio.Event() for queue in self.queues}
+        self._running: dict[str, set[asyncio.Task[None]]] = {queue: set() for queue in self.queues}
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Stop claiming jobs; ``run`` returns once the running ones have finished."""
+        self._stopping.set()
+        for wake in self._wake.values():
+            wake.set()
+
+    def _notified(self, _connection: Any, _pid: int, _channel: str, queue: str) -> None:
+        wake = self._wake.get(queue)
+        if wake is not None:
+            wake.set()
+
+    async def run(self) -> None:
+        logger.info("Job worker %s started on queues %s", self.id, self.queues)
+        async with self.bind.connect() as connection:
+            raw = await connection.get_raw_connection()
+            listener = raw.driver_connection
+            await listener.add_listener(NOTIFY_CHANNEL, self._notified)  # type: ignore[union-attr]
+            maintenance = asyncio.create_task(self._maintain())
+            try:
+                await asyncio.gather(*(self._dispatch(queue) for queue in self.queues))
+            finally:
+                maintenance.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await maintenance
+                await listener.remove_listener(NOTIFY_CHANNEL, self._notified)  # type: ignore[union-attr]
+        logger.info("Job worker %s stopped", self.id)
+
+    async def _dispatch(self, queue: str) -> None:
+        concurrency = self.queues[queue]
+        running = self._running[queue]
+        wake = self._wake[queue]
+        try:
+            while not self._stopping.is_set():
+                if len(running) >= concurrency:
+                    await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+                # Cleared before claiming, so a NOTIFY arriving during the dequeue is kept
+                wake.clear()
+                limit = min(self.batch_size, concurrency - len(running))
+                try:
+                    async with self.session_factory() as session:
+                        jobs = await JobRepository(session).dequeue(queue, limit, self.id)
+                except Exception:
+                    logger.exception("Dequeuing jobs from %s failed", queue)
+                    jobs = []
+                for job in jobs:
+                    job_task = asyncio.create_task(self._execute(job))
+                    running.add(job_task)
+                    job_task.add_done_callback(running.discard)
+                if len(jobs) < limit:
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(wake.wait(), self.poll_interval)
+        finally:
+            if running:
+                await asyncio.wait(running)
+
+    async def _execute(self, job: Job) -> None:
+        task = get_task(job.task)
+        try:
+            if task is None:
+                raise LookupError(f"No job task named {job.task} is registered")
+            await asyncio.wait_for(task(job.payload), task.timeout)
+        except asyncio.CancelledError:
+            await asyncio.shield(self._fail(job, "Cancelled"))
+            raise
+        except Exception:
+            await self._fail(job, traceback.format_exc())
+        else:
+            async with self.session_factory() as session:
+                await JobRepository(session).succeed(job)
+
+    async def _fail(self, job: Job, error: str) -> None:
+        async with self.session_factory() as session:
+            delay = await JobRepository(session).fail(job, error)
+        if delay is None:
+            logger.error("Job %s (%s) failed after %d attempts", job.id, job.task, job.attempts)
+            return
+        logger.warning(
+            "Job %s (%s) failed on attempt %d of %d, retrying in %.1fs",
+            job.id,
+            job.task,
+            job.attempts,
+            job.max_attempts,
+            delay,
+        )
+        # Wake the queue when the retry is due rather than at the next poll
+        wake = self._wake.get(job.queue)
+        if wake is not None:
+            asyncio.get_running_loop().call_later(delay, wake.set)
+
+    async def _maintain(self) -> None:
+        """Requeue jobs of lost workers and purge old finished jobs until cancelled."""
+        while True:
+            try:
+                async with self.session_factory() as session:
+                    repository = JobRepository(session)
+                    requeued = await repository.requeue_stale(settings.JOB_LOCK_TIMEOUT)
+                    await repository.purge_finished()
+            except Exception:
+                logger.exception("Job queue maintenance failed")
+            else:
+                if requeued:
+                    logger.warning("Requeued %d jobs held past JOB_LOCK_TIMEOUT", requeued)
+                    for wake in self._wake.values():
+                        wake.set()
+            await asyncio.sleep(settings.JOB_LOCK_TIMEOUT / 4)
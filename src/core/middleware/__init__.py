@@ -1,4 +1,5 @@
 from .error_handler import CustomErrorMiddleware
+from .instrumentation import InstrumentationMiddleware
 from .validation import validation_exception_handler
 
-__all__ = ["CustomErrorMiddleware", "validation_exception_handler"]
+__all__ = ["CustomErrorMiddleware", "InstrumentationMiddleware", "validation_exception_handler"]
@@ -1,63 +1,112 @@
-from collections.abc import Callable
 from typing import Any
 
-from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 from src.core.config import settings
 from src.core.error.exceptions import CustomException, DatabaseException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from src.core.helpers.serialization import json_dumps
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class CustomErrorMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable[[Request, Any]]) -> Any:
+class CustomErrorMiddleware:
+    """Turn exceptions escaping the app into JSON error responses.
+
+    A plain ASGI middleware: unlike ``BaseHTTPMiddleware`` it adds no task or memory
+    stream per request, so streaming responses pass straight through. An exception raised
+    after the response has started cannot be replaced and is re-raised.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
-        except SQLAlchemyError:
-            return await self._handle_exception(
-                request,
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            if response_started:
+                raise
+            await self._handle_exception(scope, send, exc)
+
+    async def _handle_exception(self, scope: Scope, send: Send, exc: Exception) -> None:
+        if isinstance(exc, SQLAlchemyError):
+            await self._send_error(
+                scope,
+                send,
                 message="Unexpected SQLAlchemy error occurred",
                 status_code=500,
                 user_message="A database error occurred. Please try again later.",
                 error=DatabaseException(),
             )
-        except CustomException as exc:
+        elif isinstance(exc, CustomException):
             error_msg = (
                 "Database error"
                 if isinstance(exc, DatabaseException) and not settings.DEBUG
                 else exc.message
             )
-            return await self._handle_exception(
-                request,
+            await self._send_error(
+                scope,
+                send,
                 message=f"CustomException: {error_msg}",
                 status_code=exc.code,
                 user_message="Something went wrong" if exc.code == 500 else exc.message,
                 errors=None if exc.code == 500 else exc.errors,
             )
-        except Exception as exc:  # pylint: disable=broad-exception-caught
-            return await self._handle_exception(
-                request,
+        else:
+            await self._send_error(
+                scope,
+                send,
                 message=f"Unhandled Exception: {repr(exc)}",
                 status_code=500,
             )
 
-    async def _handle_exception(
+    @staticmethod
+    def _client_ip(scope: Scope) -> str | None:
+        for name, value in scope.get("headers", ()):
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else None
+
+    async def _send_error(
         self,
-        request: Request,
+        scope: Scope,
+        send: Send,
         message: str,
         status_code: int,
         user_message: str | None = None,
         error: Any = None,
-    ) -> JSONResponse:
-        client_ip = request.headers.get(request.client.host if request.client else None)
-
-        return JSONResponse(
-            status_code=status_code,
-            content={
-                "success": False,
-                "message": user_message or message,
-                "error": str(error) if settings.DEBUG else "Please contact support",
-                "path": request.url.path,
-                "client_ip": client_ip,
-            },
+        errors: Any = None,
+    ) -> None:
+        content: dict[str, Any] = {
+            "success": False,
+            "message": user_message or message,
+            "error": str(error) if settings.DEBUG else "Please contact support",
+            "path": scope["path"],
+            "client_ip": self._client_ip(scope),
+        }
+        if errors:
+            content["errors"] = errors
+        body = json_dumps(content)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            }
         )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,78 @@
+from collections import Counter
+from time import perf_counter
+
+from src.core.config import settings
+from src.core.db.query_stats import start_query_stats, stop_query_stats
+from src.core.helpers.metrics import Histogram
+from src.core.logger import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RouteMetrics:
+    def __init__(self) -> None:
+        self.latency = Histogram()
+        self.responses: Counter[int] = Counter()
+        self.sql_statements = 0
+        self.sql_seconds = 0.0
+
+
+# Keyed by (method, route template) so path parameters do not multiply the series
+route_metrics: dict[tuple[str, str], RouteMetrics] = {}
+
+
+class InstrumentationMiddleware:
+    """Record latency, SQL statement count and SQL time per request and per route.
+
+    The database numbers come from the engine listeners in ``core.db.query_stats``. With
+    ``SERVER_TIMING_ENABLED`` they are also reported to the client as a ``Server-Timing``
+    header, measured up to the moment the response headers are sent. With
+    ``N_PLUS_ONE_DETECTION`` statements repeated within one request are logged.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.server_timing = settings.SERVER_TIMING_ENABLED
+        self.detect_repeated = settings.N_PLUS_ONE_DETECTION
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        stats, token = start_query_stats(track_statements=self.detect_repeated)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    elapsed = (perf_counter() - start) * 1000
+                    timing = (
+                        f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", '
+                        f"app;dur={elapsed:.2f}"
+                    )
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"server-timing", timing.encode("latin-1")),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stop_query_stats(token)
+            route = scope.get("route")
+            key = (scope["method"], getattr(route, "path", UNMATCHED_ROUTE))
+            metrics = route_metrics.get(key)
+            if metrics is None:
+                metrics = route_metrics[key] = RouteMetrics()
+            metrics.latency.observe(perf_counter() - start)
+            metrics.responses[status_code] += 1
+            metrics.sql_statements += stats.count
+            metrics.sql_seconds += stats.duration
+            for sql, count in stats.repeated(settings.N_PLUS_ONE_THRESHOLD).items():
+                logger.warning("Repeated query on %s %s (%d times): %s", *key, count, sql)
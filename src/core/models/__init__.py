@@ -1,3 +1,11 @@
 from .base_model import BaseModel
+from .metadata import ModelMetadata, get_model_metadata
+from .soft_delete import SoftDeleteMixin, soft_delete_models
 
-__all__ = ["BaseModel"]
+__all__ = [
+    "BaseModel",
+    "ModelMetadata",
+    "get_model_metadata",
+    "SoftDeleteMixin",
+    "soft_delete_models",
+]
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy import DateTime
 from sqlalchemy.orm import Mapped, mapped_column
@@ -8,6 +9,8 @@ from src.core.db import Base
 
 class BaseModel(Base):
     __abstract__ = True
+    # Fetch server-generated columns with RETURNING during flush instead of a later refresh()
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -16,3 +19,10 @@ class BaseModel(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), onupdate=func.now(), server_default=func.now(), nullable=False
     )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Declare the indexes the model's search backend relies on, e.g. GIN for full text
+        backend = cls.__dict__.get("__search_backend__")
+        if backend is not None and "__table__" in cls.__dict__:
+            backend.declare_indexes(cls.__table__)
@@ -0,0 +1,189 @@
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Mapper,
+    RelationshipProperty,
+    joinedload,
+    selectinload,
+)
+from src.core.db import operators_map
+from src.core.error.codes import INVALID_QUERY
+from src.core.error.exceptions import ValidationException
+
+BASE_OPERATORS = frozenset({"exact", "ne", "isnull", "in", "notin"})
+RANGE_OPERATORS = frozenset({"gt", "ge", "lt", "le", "between"})
+TEXT_OPERATORS = frozenset({"like", "ilike", "startswith", "istartswith", "endswith", "iendswith"})
+ORDERED_TYPES = (int, float, Decimal, date, datetime, time, timedelta)
+TRUE_VALUES = ("1", "true", "t", "yes")
+FALSE_VALUES = ("0", "false", "f", "no")
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _coerce_bool(value: Any) -> Any:
+    if isinstance(value, str):
+        if value.lower() in TRUE_VALUES:
+            return True
+        if value.lower() in FALSE_VALUES:
+            return False
+        return None
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class FieldMeta:
+    name: str
+    column: InstrumentedAttribute[Any]
+    python_type: type | None
+    coerce: Callable[[Any], Any]
+    operators: frozenset[str]
+
+
+class CompiledFilter(NamedTuple):
+    field: str
+    op_name: str
+    value: Any
+
+
+def _field_meta(name: str, column: InstrumentedAttribute[Any]) -> FieldMeta:
+    try:
+        python_type: type | None = column.type.python_type
+    except NotImplementedError:
+        python_type = None
+
+    coerce = _identity
+    if python_type is None:
+        allowed = frozenset(operators_map)
+    elif python_type is bool:
+        allowed = BASE_OPERATORS
+        coerce = _coerce_bool
+    elif python_type is str:
+        allowed = BASE_OPERATORS | RANGE_OPERATORS | TEXT_OPERATORS
+    elif python_type is list:
+        allowed = BASE_OPERATORS | {"overlaps"}
+    elif issubclass(python_type, ORDERED_TYPES):
+        allowed = BASE_OPERATORS | RANGE_OPERATORS
+    else:
+        allowed = BASE_OPERATORS
+    return FieldMeta(name, column, python_type, coerce, allowed)
+
+
+class ModelMetadata:
+    """Column, type and operator index of one model, used to compile the filter DSL."""
+
+    def __init__(self, model: type) -> None:
+        mapper: Mapper[Any] = inspect(model)
+        self.model = model
+        self.fields: dict[str, FieldMeta] = {
+            prop.key: _field_meta(prop.key, getattr(model, prop.key))
+            for prop in mapper.column_attrs
+        }
+        self.relationships: dict[str, RelationshipProperty[Any]] = {
+            rel.key: rel for rel in mapper.relationships
+        }
+
+    def field(self, name: str) -> FieldMeta:
+        try:
+            return self.fields[name]
+        except KeyError:
+            raise ValidationException(
+                errors={name: f"Unknown field for {self.model.__name__}"},
+                error_code=INVALID_QUERY,
+            ) from None
+
+    def compile_filters(self, filters: dict[str, Any]) -> list[CompiledFilter]:
+        """Validate ``"field__op": value`` filters and coerce their values in one pass.
+
+        Raises:
+            ValidationException: Listing every filter with an unknown field, an operator
+                not allowed for the field's type, or a value of the wrong shape.
+        """
+        compiled = []
+        errors: dict[str, str] = {}
+        for expression, value in filters.items():
+            field_name, _, op_name = expression.partition("__")
+            op_name = op_name or "exact"
+            field = self.fields.get(field_name)
+            if field is None:
+                errors[expression] = f"Unknown field for {self.model.__name__}"
+                continue
+            if op_name not in field.operators:
+                errors[expression] = f"Operator {op_name} is not supported for {field_name}"
+                continue
+            if op_name == "between" and (not isinstance(value, list | tuple) or len(value) != 2):
+                errors[expression] = "between expects a pair of values"
+                continue
+            if op_name in ("in", "notin") and not isinstance(value, list | tuple | set):
+                errors[expression] = f"{op_name} expects a list of values"
+                continue
+            compiled.append(CompiledFilter(field_name, op_name, field.coerce(value)))
+
+        if errors:
+            raise ValidationException(errors=errors, error_code=INVALID_QUERY)
+        return compiled
+
+    def build_sorting(self, sorting: dict[str, str]) -> list[Any]:
+        result = []
+        for field_name, direction in sorting.items():
+            if direction not in ("asc", "desc"):
+                raise ValidationException(
+                    errors={field_name: "Sort direction must be asc or desc"},
+                    error_code=INVALID_QUERY,
+                )
+            result.append(getattr(self.field(field_name).column, direction)())
+        return result
+
+    def prefetch_options(self, paths: Iterable[str]) -> list[Any]:
+        """Loader options for dotted relationship paths such as ``"items.product.images"``.
+
+        Each hop is planned on its own: collections use ``selectinload`` (one extra query
+        and no duplicated parent rows), scalar relationships ``joinedload`` (folded into
+        the query that loads their parent).
+
+        Raises:
+            ValidationException: Listing every path with an unknown relationship.
+        """
+        options = []
+        errors: dict[str, str] = {}
+        for path in paths:
+            metadata, loader = self, None
+            for name in path.split("."):
+                relationship = metadata.relationships.get(name)
+                if relationship is None:
+                    errors[path] = f"Unknown relationship {name!r} for {metadata.model.__name__}"
+                    break
+                attr = getattr(metadata.model, name)
+                if loader is None:
+                    loader = selectinload(attr) if relationship.uselist else joinedload(attr)
+                else:
+                    loader = (
+                        loader.selectinload(attr)
+                        if relationship.uselist
+                        else loader.joinedload(attr)
+                    )
+                metadata = get_model_metadata(relationship.mapper.class_)
+            else:
+                options.append(loader)
+
+        if errors:
+            raise ValidationException(errors=errors, error_code=INVALID_QUERY)
+        return options
+
+
+_registry: dict[type, ModelMetadata] = {}
+
+
+def get_model_metadata(model: type) -> ModelMetadata:
+    """Return the metadata of ``model``, building it on first use."""
+    metadata = _registry.get(model)
+    if metadata is None:
+        metadata = _registry.setdefault(model, ModelMetadata(model))
+    return metadata
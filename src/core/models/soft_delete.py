@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from src.core.db import Base
+
+
+class SoftDeleteMixin:
+    """Mark rows deleted with ``deleted_at`` instead of removing them.
+
+    ``BaseRepository.delete`` sets the timestamp, reads skip marked rows unless
+    ``FilterOptions.include_deleted`` is set, and ``purge_deleted`` hard-deletes them
+    once they are past retention.
+
+    Example:
+        class Cart(SoftDeleteMixin, BaseModel):
+            __tablename__ = "carts"
+    """
+
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+
+
+def soft_delete_models() -> list[type[Any]]:
+    """Every mapped model that uses :class:`SoftDeleteMixin`."""
+    return [
+        mapper.class_
+        for mapper in Base.registry.mappers
+        if issubclass(mapper.class_, SoftDeleteMixin)
+    ]
@@ -1,247 +1,1134 @@
-from collections.abc import Sequence
+import asyncio
+import json
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable, Sequence
+from datetime import timedelta
+from math import ceil
 from typing import Any, Generic
 
 from pydantic import BaseModel
-from sqlalchemy import JSON, Select, and_, cast, delete, func, or_, select, update
+from sqlalchemy import (
+    JSON,
+    Float,
+    Integer,
+    Select,
+    and_,
+    bindparam,
+    cast,
+    column,
+    delete,
+    distinct,
+    exists,
+    func,
+    insert,
+    inspect,
+    literal,
+    or_,
+    select,
+    table,
+    update,
+)
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import RelationshipProperty, joinedload, selectinload
-from src.core.db import ModelType, operators_map
-from src.core.schemas.common import FilterOptions
+from sqlalchemy.orm import Mapper, load_only, make_transient_to_detached, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.elements import ColumnElement
+from src.core.config import settings
+from src.core.db import Explain, ModelType, in_unit_of_work, operators_map
+from src.core.error.codes import INVALID_QUERY
+from src.core.error.exceptions import ValidationException
+from src.core.models.metadata import get_model_metadata
+from src.core.models.soft_delete import SoftDeleteMixin
+from src.core.repository.batch_loader import get_batch_loader, invalidate_batch_loader
+from src.core.repository.cursor import decode_cursor, encode_cursor
+from src.core.repository.result_cache import options_digest, result_cache
+from src.core.repository.search import get_search_backend
+from src.core.repository.statement_cache import get_statement_cache
+from src.core.schemas.common import FilterOptions, PaginationMeta
+
+# (filters as (field, operator, bound) triples, or_filters fields, searched fields)
+WhereShape = tuple[tuple[tuple[str, str, Any], ...], tuple[str, ...], tuple[str, ...] | None]
+
+AGGREGATE_FUNCTIONS: dict[str, Callable[[Any], Any]] = {
+    "count": func.count,
+    "count_distinct": lambda column: func.count(distinct(column)),
+    "sum": func.sum,
+    "avg": func.avg,
+    "min": func.min,
+    "max": func.max,
+}
+HAVING_OPERATORS = frozenset({"exact", "ne", "gt", "ge", "lt", "le", "between"})
 
 
 class BaseRepository(Generic[ModelType]):  # noqa: UP046
+    # Seconds to keep read results in the shared result cache; ``None`` disables caching
+    cache_ttl: float | None = None
+
     def __init__(self, model: type[ModelType], session: AsyncSession):
         self.model = model
         self.session = session
+        self.metadata = get_model_metadata(model)
+        self.mapper: Mapper[ModelType] = inspect(model)
+        self.search_backend = get_search_backend(model)
+        self.soft_delete = issubclass(model, SoftDeleteMixin)
 
     def _get_query(
         self,
         prefetch: tuple[str, ...] | None = None,
         options: list[Any] | None = None,
+        strict: bool = False,
+        projection: tuple[str, ...] | None = None,
+        row_mode: bool = False,
     ) -> Select[tuple[ModelType]]:
+        if row_mode:
+            names = projection or tuple(self.metadata.fields)
+            return select(*(self.metadata.fields[name].column for name in names))
+
         query = select(self.model)
 
+        options = list(options or [])
+        if projection:
+            columns = [self.metadata.fields[name].column for name in projection]
+            options.append(load_only(*columns, raiseload=strict))
         if prefetch:
-            if options is None:
-                options = []
-            for relation in prefetch:
-                attr = getattr(self.model, relation)
-
-                if hasattr(attr, "property") and isinstance(attr.property, RelationshipProperty):
-                    if attr.property.uselist:
-                        options.append(selectinload(attr))
-                    else:
-                        options.append(joinedload(attr))
-            query = query.options(*options).execution_options(populate_existing=True)
+            options.extend(self.metadata.prefetch_options(prefetch))
+        if strict:
+            # Prefetched paths override the wildcard; identity-map hits stay allowed
+            options.append(raiseload("*", sql_only=True))
+        if options:
+            query = query.options(*options)
+        if prefetch:
+            query = query.execution_options(populate_existing=True)
 
         return query
 
+    def _loading(self, filter_options: FilterOptions) -> dict[str, Any]:
+        """``_get_query`` arguments for ``filter_options``; also part of statement cache keys."""
+        return {
+            "prefetch": filter_options.prefetch,
+            "strict": self._strict(filter_options),
+            "projection": self._projection(filter_options),
+            "row_mode": filter_options.row_mode,
+        }
+
+    def _loading_key(self, filter_options: FilterOptions) -> tuple[Any, ...]:
+        return tuple(self._loading(filter_options).values())
+
+    def _projection(self, filter_options: FilterOptions) -> tuple[str, ...] | None:
+        """Fields to load: ``projection`` plus id and sort keys.
+
+        Projection is opt-in: a caller that sets ``projection`` from the client's
+        ``fields`` must also serialize with a matching schema (see ``partial_schema``),
+        since unloaded attributes raise.
+
+        Raises:
+            ValidationException: Listing unknown fields, or prefetch combined with rows.
+        """
+        fields = filter_options.projection
+        errors: dict[str, str] = {}
+        if filter_options.row_mode and filter_options.prefetch:
+            errors["prefetch"] = "Relationships cannot be prefetched in row mode"
+        if fields:
+            errors.update(
+                (name, f"Unknown field for {self.model.__name__}")
+                for name in fields
+                if name not in self.metadata.fields
+            )
+        if errors:
+            raise ValidationException(errors=errors, error_code=INVALID_QUERY)
+        if not fields:
+            return None
+        # Cursors and identity need id and the sort keys even when the client left them out
+        return tuple(dict.fromkeys(("id", *fields, *(filter_options.sorting or {}))))
+
+    def _strict(self, filter_options: FilterOptions) -> bool:
+        if filter_options.strict_loading is None:
+            return settings.DB_STRICT_LOADING
+        return filter_options.strict_loading
+
     def _build_sorting(self, sorting: dict[str, str]) -> list[Any]:
         """Build list of ORDER_BY clauses."""
-        result = []
-        for field_name, direction in sorting.items():
-            field = getattr(self.model, field_name)
-            result.append(getattr(field, direction)())
-        return result
+        return self.metadata.build_sorting(sorting)
 
     def _build_filters(self, filters: dict[str, Any]) -> list[Any]:
         """Build list of WHERE conditions."""
-        result = []
-        for expression, value in filters.items():
-            parts = expression.split("__")
-            op_name = parts[1] if len(parts) > 1 else "exact"
-            if op_name not in operators_map:
-                msg = f"Expression {expression} has incorrect operator {op_name}"
-                raise KeyError(msg)
+        return [
+            operators_map[op_name](self.metadata.fields[field_name].column, value)
+            for field_name, op_name, value in self.metadata.compile_filters(filters)
+        ]
+
+    def _where_params(
+        self,
+        filter_options: FilterOptions,
+        search: bool = False,
+    ) -> tuple[WhereShape, dict[str, Any]]:
+        """Split ``filter_options`` into a hashable WHERE shape and its bind values.
+
+        The shape keeps everything that changes the SQL text (fields, operators, NULL
+        checks, or_filters, searched fields); the values go to the parameter dict, so two
+        requests that differ only in values share one cached statement.
+        """
+        shape: list[tuple[str, str, Any]] = []
+        params: dict[str, Any] = {}
+        compiled = self.metadata.compile_filters(dict(sorted(filter_options.filters.items())))
+        for index, (field_name, op_name, value) in enumerate(compiled):
+            name = f"f{index}"
+            bound: Any
+            if op_name == "isnull":
+                bound = bool(value)
+            elif value is None:
+                bound = None
+            elif op_name == "between":
+                params[f"{name}_lo"], params[f"{name}_hi"] = value
+                bound = "range"
+            else:
+                params[name] = value
+                bound = "value"
+            shape.append((field_name, op_name, bound))
+        if self.soft_delete and not filter_options.include_deleted:
+            shape.append(("deleted_at", "isnull", True))
+
+        search_shape = None
+        pagination = filter_options.pagination
+        if search and pagination and pagination.search:
+            search_shape = self.search_backend.fields(filter_options.search_fields)
+            if search_shape:
+                params["search"] = self.search_backend.bind_value(pagination.search.strip())
+
+        or_shape = tuple(sorted(filter_options.or_filters or ()))
+        return (tuple(shape), or_shape, search_shape), params
+
+    def _build_where(self, where_shape: WhereShape) -> Any:
+        """Build the WHERE condition of a shape, with bind parameters in place of values."""
+        filter_shape, or_shape, search_shape = where_shape
+
+        or_conditions = []
+        and_conditions = []
+        for index, (field_name, op_name, bound) in enumerate(filter_shape):
             operator = operators_map[op_name]
-            column = getattr(self.model, parts[0])
-
-            if isinstance(column.type.python_type, type) and column.type.python_type is bool:  # noqa: SIM102
-                if isinstance(value, str):
-                    if value.lower() in ("1", "true", "t", "yes", "True"):
-                        value = True
-                    elif value.lower() in ("0", "false", "f", "no", "False"):
-                        value = False
-                    else:
-                        value = None
-            result.append(operator(column, value))
-        return result
+            column = self.metadata.fields[field_name].column
+            name = f"f{index}"
+            if op_name == "isnull" or bound is None:
+                filter_expr = operator(column, bound)
+            elif bound == "range":
+                filter_expr = operator(column, (bindparam(f"{name}_lo"), bindparam(f"{name}_hi")))
+            else:
+                filter_expr = operator(
+                    column, bindparam(name, expanding=op_name in ("in", "notin"))
+                )
+
+            if field_name in or_shape:
+                or_conditions.append(filter_expr)
+            else:
+                and_conditions.append(filter_expr)
+
+        combined_conditions = []
+        if and_conditions:
+            combined_conditions.append(and_(*and_conditions))
+        if or_conditions:
+            combined_conditions.append(or_(*or_conditions))
+        if search_shape:
+            combined_conditions.append(
+                self.search_backend.condition(
+                    self._search_columns(search_shape), bindparam("search")
+                )
+            )
+        return and_(*combined_conditions) if combined_conditions else None
+
+    def _search_columns(self, search_shape: tuple[str, ...]) -> list[Any]:
+        return [self.metadata.field(field).column for field in search_shape]
+
+    def _ranked(
+        self, filter_options: FilterOptions, where_shape: WhereShape, mode: str | None
+    ) -> bool:
+        """Whether a page is ordered by search relevance rather than by sort columns."""
+        return (
+            self.search_backend.ranked
+            and where_shape[2] is not None
+            and filter_options.sorting is None
+            and mode in (None, "offset")
+        )
+
+    def _cached(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        return get_statement_cache(self.model).get_or_build(key, build)
+
+    def _sorting_key(self, sorting: dict[str, str] | None) -> tuple[tuple[str, str], ...] | None:
+        return tuple(sorting.items()) if sorting is not None else None
+
+    def _cache_enabled(self, filter_options: FilterOptions) -> bool:
+        # Results loaded inside a unit of work may include writes that are later rolled back
+        return (
+            self.cache_ttl is not None
+            and not filter_options.prefetch
+            and not in_unit_of_work(self.session)
+        )
+
+    def _snapshot(self, obj: ModelType) -> dict[str, Any]:
+        state = obj.__dict__
+        return {key: state[key] for key in self.metadata.fields if key in state}
+
+    async def _restore(self, snapshot: dict[str, Any]) -> ModelType:
+        """Rebuild a cached row as a clean instance attached to this repository's session."""
+        obj = self.mapper.class_manager.new_instance()
+        for key, value in snapshot.items():
+            set_committed_value(obj, key, value)
+        make_transient_to_detached(obj)
+        return await self.session.merge(obj, load=False)
+
+    def _snapshot_row(self, row: Any, row_mode: bool) -> dict[str, Any]:
+        return dict(row) if row_mode else self._snapshot(row)
+
+    async def _restore_row(self, snapshot: dict[str, Any], row_mode: bool) -> Any:
+        return dict(snapshot) if row_mode else await self._restore(snapshot)
+
+    async def _invalidate(self, ids: Iterable[Any] | None = None) -> None:
+        invalidate_batch_loader(self.session, [self.model])
+        await result_cache.invalidate(self.model, ids)
+
+    def _filtered_ids(self, filters: dict[str, Any]) -> list[Any] | None:
+        """Row ids a write is limited to, if its filters pin them; ``None`` means unknown."""
+        if len(filters) != 1:
+            return None
+        ((expression, value),) = filters.items()
+        if expression in ("id", "id__exact"):
+            return [value]
+        if expression == "id__in":
+            return list(value)
+        return None
+
+    def _live(self, include_deleted: bool) -> Any:
+        """Condition hiding soft-deleted rows, or ``None`` when there is nothing to hide."""
+        if not self.soft_delete or include_deleted:
+            return None
+        return self.model.deleted_at.is_(None)  # type: ignore[attr-defined]
 
     async def get_by_id(
         self,
         obj_id: int,
         filter_options: FilterOptions,
-    ) -> ModelType | None:
-        query = self._get_query(prefetch=filter_options.prefetch).where(self.model.id == obj_id)  # type:ignore
+    ) -> ModelType | dict[str, Any] | None:
+        if not self._cache_enabled(filter_options):
+            return await self._fetch_by_id(obj_id, filter_options)
+
+        row_mode = filter_options.row_mode
+
+        async def load() -> dict[str, Any] | None:
+            obj = await self._fetch_by_id(obj_id, filter_options)
+            return self._snapshot_row(obj, row_mode) if obj is not None else None
+
+        key = await result_cache.row_key(self.model, obj_id, options_digest(filter_options))
+        snapshot = await result_cache.get_or_load(key, load, self.cache_ttl)
+        return await self._restore_row(snapshot, row_mode) if snapshot is not None else None
+
+    async def _fetch_by_id(
+        self,
+        obj_id: int,
+        filter_options: FilterOptions,
+    ) -> ModelType | dict[str, Any] | None:
+        loading = self._loading(filter_options)
+        if settings.DB_BATCH_LOADING and not (
+            loading["prefetch"] or loading["projection"] or loading["row_mode"]
+        ):
+            return await self._batched(
+                "id",
+                obj_id,
+                unique=True,
+                strict=loading["strict"],
+                include_deleted=filter_options.include_deleted,
+            )
+
+        query = self._get_query(**loading)
+        query = query.where(self.model.id == obj_id)  # type:ignore
+        live = self._live(filter_options.include_deleted)
+        if live is not None:
+            query = query.where(live)
 
         session = self.session
         result = await session.execute(query)
+        if filter_options.row_mode:
+            row = result.mappings().first()
+            return dict(row) if row is not None else None
         return result.scalars().first()
 
+    async def _batched(
+        self,
+        field_name: str,
+        value: Any,
+        unique: bool,
+        strict: bool,
+        include_deleted: bool = False,
+    ) -> Any:
+        """Look ``value`` up through the session's batch loader, one ``IN`` query per tick."""
+        column = self.metadata.field(field_name).column
+        live = self._live(include_deleted)
+
+        def build() -> Select[tuple[ModelType]]:
+            query = self._get_query(strict=strict).where(
+                column.in_(bindparam("keys", expanding=True))
+            )
+            if live is not None:
+                query = query.where(live)
+            return query.order_by(self.model.id)  # type: ignore[attr-defined]
+
+        async def fetch(keys: list[Any]) -> dict[Any, Any]:
+            query = self._cached(("batch", field_name, strict, live is not None), build)
+            rows = (await self.session.execute(query, {"keys": keys})).scalars().all()
+            if unique:
+                return {getattr(row, field_name): row for row in rows}
+            grouped: dict[Any, list[ModelType]] = {key: [] for key in keys}
+            for row in rows:
+                grouped[getattr(row, field_name)].append(row)
+            return grouped
+
+        loader = get_batch_loader(self.session)
+        return await loader.load(
+            (self.model, (field_name, unique, strict, live is not None)), value, fetch
+        )
+
+    async def get_related(
+        self,
+        field_name: str,
+        value: Any,
+        filter_options: FilterOptions | None = None,
+    ) -> list[ModelType]:
+        """Rows whose ``field_name`` equals ``value``, e.g. the items of one cart.
+
+        Meant for foreign keys: concurrent calls for different values are loaded with one
+        ``WHERE field IN (...)`` query and cached for the rest of the request.
+
+        Example:
+            items = await asyncio.gather(*(repo.get_related("cart_id", c.id) for c in carts))
+        """
+        filter_options = filter_options or FilterOptions(filters={})
+        rows = await self._batched(
+            field_name,
+            value,
+            unique=False,
+            strict=self._strict(filter_options),
+            include_deleted=filter_options.include_deleted,
+        )
+        return list(rows)
+
     async def list_all(
         self,
         filter_options: FilterOptions,
-    ) -> Sequence[ModelType]:
-        query = self._get_query(filter_options.prefetch)
+    ) -> Sequence[ModelType] | Sequence[dict[str, Any]]:
+        query = self._get_query(**self._loading(filter_options))
 
+        live = self._live(filter_options.include_deleted)
+        if live is not None:
+            query = query.where(live)
         if filter_options.sorting is not None:
             query = query.order_by(*self._build_sorting(sorting=filter_options.sorting))
 
         session = self.session
         result = await session.execute(query)
+        if filter_options.row_mode:
+            return [dict(row) for row in result.mappings()]
         return result.scalars().all()
 
-    async def get_by_filed(
+    def _build_filter_query(
         self,
         filter_options: FilterOptions,
-    ) -> ModelType | None:
-        query = self._get_query(prefetch=filter_options.prefetch)
+        where_shape: WhereShape,
+    ) -> Select[tuple[ModelType]]:
+        query = self._get_query(**self._loading(filter_options))
 
         if filter_options.distinct_on:
-            query = query.distinct(getattr(self.model, filter_options.distinct_on))
-
+            query = query.distinct(self.metadata.field(filter_options.distinct_on).column)
         if filter_options.sorting is not None:
             query = query.order_by(*self._build_sorting(filter_options.sorting))
 
-        or_conditions = []
-        and_conditions = []
+        final_condition = self._build_where(where_shape)
+        if final_condition is not None:
+            query = query.where(final_condition)
+        return query
 
-        filters = self._build_filters(filter_options.filters)
+    def _filter_statement(
+        self,
+        filter_options: FilterOptions,
+    ) -> tuple[Select[tuple[ModelType]], dict[str, Any]]:
+        where_shape, params = self._where_params(filter_options)
+        key = (
+            "filter",
+            where_shape,
+            self._loading_key(filter_options),
+            self._sorting_key(filter_options.sorting),
+            filter_options.distinct_on,
+        )
+        query = self._cached(key, lambda: self._build_filter_query(filter_options, where_shape))
+        return query, params
 
-        for filter_expr in filters:
-            if hasattr(filter_expr, "left") and hasattr(filter_expr.left, "key"):
-                if (
-                    filter_options.or_filters is not None
-                    and filter_expr.left.key in filter_options.or_filters
-                ):
-                    or_conditions.append(filter_expr)
-                else:
-                    and_conditions.append(filter_expr)
-
-        final_condition = None
-        if and_conditions or or_conditions:
-            combined_conditions = []
-            if and_conditions:
-                combined_conditions.append(and_(*and_conditions))
-            if or_conditions:
-                combined_conditions.append(or_(*or_conditions))
-            final_condition = and_(*combined_conditions) if combined_conditions else None
+    async def get_by_filed(
+        self,
+        filter_options: FilterOptions,
+    ) -> ModelType | dict[str, Any] | None:
+        query, params = self._filter_statement(filter_options)
         session = self.session
-        db_execute = await session.execute(query.where(final_condition))  # type: ignore
+        db_execute = await session.execute(query, params)
+        if filter_options.row_mode:
+            row = db_execute.mappings().first()
+            return dict(row) if row is not None else None
         return db_execute.scalars().first()
 
     async def filter(
         self,
         filter_options: FilterOptions,  # same object you pass to get_field
-    ) -> Sequence[ModelType]:
+    ) -> Sequence[ModelType] | Sequence[dict[str, Any]]:
+        """Return every row matching ``filter_options``.
+
+        With ``row_mode`` the rows are plain dicts of the projected fields, read without
+        creating ORM instances.
+        """
+        if not self._cache_enabled(filter_options):
+            return await self._fetch_filter(filter_options)
+
+        row_mode = filter_options.row_mode
+
+        async def load() -> list[dict[str, Any]]:
+            rows = await self._fetch_filter(filter_options)
+            return [self._snapshot_row(row, row_mode) for row in rows]
+
+        key = await result_cache.list_key(self.model, "filter", options_digest(filter_options))
+        snapshots = await result_cache.get_or_load(key, load, self.cache_ttl)
+        return [await self._restore_row(snapshot, row_mode) for snapshot in snapshots]
+
+    async def _fetch_filter(
+        self, filter_options: FilterOptions
+    ) -> Sequence[ModelType] | Sequence[dict[str, Any]]:
+        query, params = self._filter_statement(filter_options)
         session = self.session
-        query = self._get_query(prefetch=filter_options.prefetch)
+        result = await session.execute(query, params)
+        if filter_options.row_mode:
+            return [dict(row) for row in result.mappings()]
+        return result.scalars().all()
 
-        if filter_options.distinct_on:
-            query = query.distinct(getattr(self.model, filter_options.distinct_on))
-        if filter_options.sorting is not None:
-            query = query.order_by(*self._build_sorting(filter_options.sorting))
+    async def stream(
+        self,
+        filter_options: FilterOptions,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Any]:
+        """Yield rows matching ``filter_options`` without loading the whole result.
 
-        filters = self._build_filters(filter_options.filters)
+        Rows come from a server-side cursor ``batch_size`` at a time (``yield_per``), so
+        memory stays flat however large the table is. Yielded instances are only weakly
+        held by the session and are released once the caller drops them; in
+        ``row_mode`` dicts are yielded instead.
+        """
+        query, params = self._filter_statement(filter_options)
+        execution_options = {"yield_per": batch_size}
+        if filter_options.row_mode:
+            rows = await self.session.stream(query, params, execution_options=execution_options)
+            async for partition in rows.mappings().partitions():
+                for row in partition:
+                    yield dict(row)
+            return
 
-        or_conditions = []
-        and_conditions = []
+        result = await self.session.stream_scalars(
+            query, params, execution_options=execution_options
+        )
+        async for objs in result.partitions():
+            for obj in objs:
+                yield obj
 
-        for filter_expr in filters:
-            if hasattr(filter_expr, "left") and hasattr(filter_expr.left, "key"):
-                if (
-                    filter_options.or_filters is not None
-                    and filter_expr.left.key in filter_options.or_filters
-                ):
-                    or_conditions.append(filter_expr)
-                else:
-                    and_conditions.append(filter_expr)
-        final_condition = None
-        if and_conditions or or_conditions:
-            combined_conditions = []
-            if and_conditions:
-                combined_conditions.append(and_(*and_conditions))
-            if or_conditions:
-                combined_conditions.append(or_(*or_conditions))
-            final_condition = and_(*combined_conditions) if combined_conditions else None
+    def _keyset_sort_spec(self, sorting: dict[str, str] | None) -> list[tuple[str, str]]:
+        """Sort order used for pagination, with ``id`` appended as a unique tie-breaker."""
+        sort_spec = list((sorting or {}).items())
+        if all(field_name != "id" for field_name, _ in sort_spec):
+            sort_spec.append(("id", sort_spec[-1][1] if sort_spec else "asc"))
+        return sort_spec
+
+    def _build_keyset_condition(
+        self,
+        sort_spec: list[tuple[str, str]],
+        reverse: bool = False,
+    ) -> Any:
+        """Build the row-comparison predicate that seeks past a cursor.
+
+        For ``a asc, b desc, id asc`` this yields
+        ``a > :k0 OR (a = :k0 AND b < :k1) OR (a = :k0 AND b = :k1 AND id > :k2)``,
+        which handles mixed directions where a plain row-value comparison cannot.
+
+        Postgres sorts ``NULL`` after every value ascending and before them descending, so
+        on nullable columns ``NULL`` is compared as the largest value and equality is
+        ``IS NOT DISTINCT FROM``; a plain ``col > NULL`` would drop the remaining rows.
+        """
+        columns = [self.metadata.field(field_name).column for field_name, _ in sort_spec]
+        values: list[Any] = [
+            bindparam(f"k{index}", type_=column.type) for index, column in enumerate(columns)
+        ]
+        equals = [
+            column.is_not_distinct_from(value) if column.nullable else column == value
+            for column, value in zip(columns, values, strict=True)
+        ]
+        clauses = []
+        for index, (_, direction) in enumerate(sort_spec):
+            column, value = columns[index], values[index]
+            ascending = (direction == "asc") != reverse
+            seek = column > value if ascending else column < value
+            if column.nullable and ascending:
+                seek = or_(seek, and_(column.is_(None), value.is_not(None)))
+            elif column.nullable:
+                seek = or_(seek, and_(column.is_not(None), value.is_(None)))
+            clauses.append(and_(*equals[:index], seek))
+        return or_(*clauses)
+
+    def _count_query(self, condition: Any) -> Select[tuple[int]]:
+        query = select(func.count()).select_from(self.model)
+        if condition is not None:
+            query = query.where(condition)
+        return query
+
+    async def _count(self, where_shape: WhereShape, params: dict[str, Any]) -> int:
+        query = self._cached(
+            ("count", where_shape), lambda: self._count_query(self._build_where(where_shape))
+        )
+        return await self.session.scalar(query, params) or 0
 
+    def _build_estimate_query(self, where_shape: WhereShape) -> Any:
+        condition = self._build_where(where_shape)
+        if condition is None:
+            return (
+                select(column("reltuples", Float))
+                .select_from(table("pg_class"))
+                .where(column("oid") == func.to_regclass(self.model.__tablename__))
+            )
+        return Explain(select(literal(1)).select_from(self.model).where(condition))
+
+    async def _estimate_count(self, where_shape: WhereShape, params: dict[str, Any]) -> int | None:
+        """Return the planner's row estimate, or ``None`` if the table was never analyzed.
+
+        Unfiltered counts read ``pg_class.reltuples`` directly; filtered ones take the
+        top-level ``Plan Rows`` of ``EXPLAIN`` for the matching query.
+        """
+        query = self._cached(
+            ("estimate", where_shape), lambda: self._build_estimate_query(where_shape)
+        )
+        estimate = await self.session.scalar(query, params)
+        if not isinstance(query, Explain):
+            return int(estimate) if estimate is not None and estimate >= 0 else None
+
+        if isinstance(estimate, str):
+            estimate = json.loads(estimate)
+        return int(estimate[0]["Plan"]["Plan Rows"])
+
+    def _row_cursor(self, row: Any, sort_spec: list[tuple[str, str]]) -> str:
+        if isinstance(row, dict):
+            return encode_cursor(sort_spec, [row[field_name] for field_name, _ in sort_spec])
+        return encode_cursor(sort_spec, [getattr(row, field_name) for field_name, _ in sort_spec])
+
+    def _build_page_query(
+        self,
+        filter_options: FilterOptions,
+        where_shape: WhereShape,
+        sort_spec: list[tuple[str, str]],
+        mode: str | None,
+        with_window: bool,
+    ) -> Select[Any]:
+        query: Select[Any] = self._get_query(**self._loading(filter_options))
+        final_condition = self._build_where(where_shape)
         if final_condition is not None:
             query = query.where(final_condition)
 
-        result = await session.execute(query)
-        return result.scalars().all()
+        if with_window:
+            # A window count is taken after WHERE, so behind a keyset seek it would only see
+            # the rows past the cursor; use a scalar subquery in the same statement instead.
+            total_column = (
+                self._count_query(final_condition).scalar_subquery()
+                if mode in ("after", "before")
+                else func.count().over()
+            )
+            query = query.add_columns(total_column.label("total_count"))
+
+        rank_order = []
+        if self._ranked(filter_options, where_shape, mode):
+            search_shape = where_shape[2] or ()
+            rank = self.search_backend.rank(self._search_columns(search_shape), bindparam("search"))
+            rank_order = [rank.desc()] if rank is not None else []
+
+        if mode is None:
+            if rank_order:
+                query = query.order_by(*rank_order, *self._build_sorting(dict(sort_spec)))
+            elif filter_options.sorting is not None:
+                query = query.order_by(*self._build_sorting(filter_options.sorting))
+            return query
+
+        reverse = mode == "before"
+        if mode == "offset":
+            query = query.offset(bindparam("offset", type_=Integer))
+        else:
+            query = query.where(self._build_keyset_condition(sort_spec, reverse))
+
+        order_spec = [
+            (field_name, ("desc" if direction == "asc" else "asc") if reverse else direction)
+            for field_name, direction in sort_spec
+        ]
+        return query.order_by(*rank_order, *self._build_sorting(dict(order_spec))).limit(
+            bindparam("limit", type_=Integer)
+        )
 
     async def paginate_filters(
         self,
         filter_options: FilterOptions,
-    ) -> tuple[Sequence[ModelType], int]:
-        query = self._get_query(prefetch=filter_options.prefetch)
+    ) -> tuple[Sequence[ModelType] | Sequence[dict[str, Any]], PaginationMeta]:
+        """Return one page of rows matching ``filter_options`` and its pagination meta.
 
-        if filter_options.sorting is not None:
-            query = query.order_by(*self._build_sorting(filter_options.sorting))
+        With ``pagination.after``/``pagination.before`` set the page is fetched by keyset
+        seek on the sort columns instead of ``OFFSET``, so every page costs the same as the
+        first. Both modes return ``next_cursor``/``prev_cursor`` in the meta.
+        """
+        if not self._cache_enabled(filter_options):
+            return await self._fetch_page(filter_options)
 
-        filters = self._build_filters(filter_options.filters)
+        row_mode = filter_options.row_mode
 
-        or_conditions = []
-        and_conditions = []
-        search_conditions = []
-
-        search_fields = filter_options.search_fields
-
-        if filter_options.pagination and filter_options.pagination.search and search_fields:
-            search_value = filter_options.pagination.search.strip()
-            for field in search_fields:
-                search_conditions.append(getattr(self.model, field).ilike(f"%{search_value}%"))
-
-        for filter_expr in filters:
-            if hasattr(filter_expr, "left") and hasattr(filter_expr.left, "key"):
-                if (
-                    filter_options.or_filters is not None
-                    and filter_expr.left.key in filter_options.or_filters
-                ):
-                    or_conditions.append(filter_expr)
-                else:
-                    and_conditions.append(filter_expr)
+        async def load() -> tuple[list[dict[str, Any]], PaginationMeta]:
+            rows, meta = await self._fetch_page(filter_options)
+            return [self._snapshot_row(row, row_mode) for row in rows], meta
 
-        final_condition = None
-        if and_conditions or or_conditions or search_conditions:
-            combined_conditions = []
-            if and_conditions:
-                combined_conditions.append(and_(*and_conditions))
-            if or_conditions:
-                combined_conditions.append(or_(*or_conditions))
-            if search_conditions:
-                combined_conditions.append(or_(*search_conditions))
+        key = await result_cache.list_key(self.model, "page", options_digest(filter_options))
+        snapshots, meta = await result_cache.get_or_load(key, load, self.cache_ttl)
+        rows = [await self._restore_row(snapshot, row_mode) for snapshot in snapshots]
+        return rows, meta.model_copy()
 
-            final_condition = and_(*combined_conditions) if combined_conditions else None
+    async def _fetch_page(
+        self,
+        filter_options: FilterOptions,
+    ) -> tuple[Sequence[ModelType] | Sequence[dict[str, Any]], PaginationMeta]:
+        pagination = filter_options.pagination
+        where_shape, params = self._where_params(filter_options, search=True)
 
         session = self.session
-        total_query = select(func.count()).select_from(self.model)
-        if final_condition is not None:
-            total_query = total_query.where(final_condition)
-        total = await session.scalar(total_query) or 0
+        count_strategy = filter_options.count_strategy
+        total: int | None = None
+        if count_strategy == "exact":
+            total = await self._count(where_shape, params)
+        elif count_strategy == "estimated":
+            total = await self._estimate_count(where_shape, params)
+            if total is None or total < filter_options.estimated_count_threshold:
+                total, count_strategy = await self._count(where_shape, params), "exact"
+        with_window = count_strategy == "exact_window"
 
-        if filter_options.pagination:
-            query = query.offset(filter_options.pagination.skip).limit(
-                filter_options.pagination.page_size
+        mode = None
+        sort_spec = self._keyset_sort_spec(filter_options.sorting)
+        page_params = dict(params)
+        if pagination is not None:
+            page_size = pagination.page_size
+            page_params["limit"] = page_size + 1
+            if pagination.is_cursor:
+                mode = "before" if pagination.before else "after"
+                cursor = pagination.before or pagination.after
+                values = decode_cursor(cursor, sort_spec)  # type: ignore[arg-type]
+                page_params.update({f"k{index}": value for index, value in enumerate(values)})
+            else:
+                mode = "offset"
+                page_params["offset"] = pagination.skip
+
+        key = (
+            "page",
+            where_shape,
+            self._loading_key(filter_options),
+            self._sorting_key(filter_options.sorting),
+            mode,
+            with_window,
+        )
+        query = self._cached(
+            key,
+            lambda: self._build_page_query(
+                filter_options, where_shape, sort_spec, mode, with_window
+            ),
+        )
+        db_execute = await session.execute(query, page_params)
+
+        result: list[Any]
+        if with_window:
+            rows = db_execute.all()
+            if filter_options.row_mode:
+                result = [dict(row._mapping) for row in rows]
+                for row_dict in result:
+                    del row_dict["total_count"]
+            else:
+                result = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total_count
+            elif mode == "offset" and page_params["offset"]:
+                # Past the last page there is no row to carry the window total
+                total = await self._count(where_shape, params)
+            else:
+                total = 0
+        elif filter_options.row_mode:
+            result = [dict(row) for row in db_execute.mappings()]
+        else:
+            result = list(db_execute.scalars().all())
+
+        if pagination is None:
+            return result, PaginationMeta(
+                total=total,
+                current_page=1,
+                next_page=None,
+                prev_page=None,
+                last_page=1,
+                page_size=len(result),
+                count_strategy=count_strategy,
             )
 
-        if final_condition is not None:
-            query = query.where(final_condition)
-        db_execute = await session.execute(query)
-        result = db_execute.scalars().all()
+        has_more = len(result) > page_size
+        result = result[:page_size]
+        reverse = mode == "before"
+        if reverse:
+            result.reverse()
+
+        if self._ranked(filter_options, where_shape, mode):
+            # Relevance is not a column a cursor could seek on
+            sort_spec = []
+        if pagination.is_cursor:
+            has_next = True if reverse else has_more
+            has_prev = has_more if reverse else True
+            next_page = prev_page = None
+        else:
+            has_next = has_more
+            has_prev = pagination.skip > 0
+            next_page = pagination.page + 1 if has_next else None
+            prev_page = pagination.page - 1 if has_prev else None
+
+        return result, PaginationMeta(
+            total=total,
+            current_page=pagination.page,
+            next_page=next_page,
+            prev_page=prev_page,
+            last_page=max(ceil(total / page_size), 1) if total is not None else None,
+            page_size=page_size,
+            count_strategy=count_strategy,
+            next_cursor=(
+                self._row_cursor(result[-1], sort_spec)
+                if has_next and result and sort_spec
+                else None
+            ),
+            prev_cursor=(
+                self._row_cursor(result[0], sort_spec)
+                if has_prev and result and sort_spec
+                else None
+            ),
+        )
+
+    async def exists(self, filter_options: FilterOptions) -> bool:
+        """Whether any row matches ``filter_options``; stops at the first match."""
+        where_shape, params = self._where_params(filter_options, search=True)
+
+        def build() -> Select[tuple[bool]]:
+            condition = self._build_where(where_shape)
+            subquery = select(literal(1)).select_from(self.model)
+            if condition is not None:
+                subquery = subquery.where(condition)
+            return select(exists(subquery))
+
+        query = self._cached(("exists", where_shape), build)
+        return bool(await self.session.scalar(query, params))
 
-        return result, total
+    def _aggregate_metrics(self, metrics: dict[str, tuple[str, str]]) -> dict[str, Any]:
+        """Build ``alias -> aggregate expression``; ``("count", "*")`` counts rows."""
+        columns: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for alias, (function_name, field_name) in metrics.items():
+            function = AGGREGATE_FUNCTIONS.get(function_name)
+            if function is None:
+                errors[alias] = f"Unknown aggregate function {function_name}"
+            elif field_name == "*" and function_name == "count":
+                columns[alias] = func.count()
+            elif field_name not in self.metadata.fields:
+                errors[alias] = f"Unknown field for {self.model.__name__}"
+            else:
+                columns[alias] = function(self.metadata.fields[field_name].column)
+        if errors:
+            raise ValidationException(errors=errors, error_code=INVALID_QUERY)
+        return columns
+
+    def _having_params(
+        self, having: dict[str, Any], metric_names: Iterable[str]
+    ) -> tuple[tuple[tuple[str, str], ...], dict[str, Any]]:
+        shape = []
+        params: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for index, (expression, value) in enumerate(sorted(having.items())):
+            alias, _, op_name = expression.partition("__")
+            op_name = op_name or "exact"
+            if alias not in metric_names:
+                errors[expression] = "HAVING must refer to a metric"
+            elif op_name not in HAVING_OPERATORS:
+                errors[expression] = f"Operator {op_name} is not supported in HAVING"
+            elif op_name == "between":
+                if not isinstance(value, list | tuple) or len(value) != 2:
+                    errors[expression] = "between expects a pair of values"
+                else:
+                    params[f"h{index}_lo"], params[f"h{index}_hi"] = value
+            else:
+                params[f"h{index}"] = value
+            shape.append((alias, op_name))
+        if errors:
+            raise ValidationException(errors=errors, error_code=INVALID_QUERY)
+        return tuple(shape), params
+
+    def _build_aggregate_query(
+        self,
+        where_shape: WhereShape,
+        group_by: tuple[str, ...],
+        metrics: dict[str, tuple[str, str]],
+        having_shape: tuple[tuple[str, str], ...],
+        sorting: dict[str, str] | None,
+    ) -> Select[Any]:
+        group_columns = [self.metadata.field(name).column for name in group_by]
+        metric_columns = self._aggregate_metrics(metrics)
+        query = select(
+            *group_columns,
+            *(expression.label(alias) for alias, expression in metric_columns.items()),
+        ).select_from(self.model)
+
+        condition = self._build_where(where_shape)
+        if condition is not None:
+            query = query.where(condition)
+        if group_columns:
+            query = query.group_by(*group_columns)
+
+        for index, (alias, op_name) in enumerate(having_shape):
+            bound: Any = (
+                (bindparam(f"h{index}_lo"), bindparam(f"h{index}_hi"))
+                if op_name == "between"
+                else bindparam(f"h{index}")
+            )
+            query = query.having(operators_map[op_name](metric_columns[alias], bound))
+
+        order_by = []
+        for name, direction in (sorting or {}).items():
+            if direction not in ("asc", "desc"):
+                raise ValidationException(
+                    errors={name: "Sort direction must be asc or desc"},
+                    error_code=INVALID_QUERY,
+                )
+            if name in metric_columns:
+                order_by.append(getattr(column(name), direction)())
+            elif name in group_by:
+                order_by.append(getattr(self.metadata.field(name).column, direction)())
+            else:
+                raise ValidationException(
+                    errors={name: "Can only sort by group_by fields or metrics"},
+                    error_code=INVALID_QUERY,
+                )
+        return query.order_by(*order_by)
+
+    async def aggregate(
+        self,
+        filter_options: FilterOptions,
+        group_by: Sequence[str] | None = None,
+        metrics: dict[str, tuple[str, str]] | None = None,
+        having: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Aggregate rows matching ``filter_options`` in SQL, one dict per group.
+
+        ``metrics`` maps output names to ``(function, field)`` with ``count``,
+        ``count_distinct``, ``sum``, ``avg``, ``min`` or ``max``; ``having`` filters groups
+        with the filter syntax on metric names and ``filter_options.sorting`` may order by
+        group fields or metrics.
+
+        Example:
+            await orders.aggregate(
+                FilterOptions(filters={"status": "paid"}, sorting={"revenue": "desc"}),
+                group_by=["customer_id"],
+                metrics={"orders": ("count", "*"), "revenue": ("sum", "amount")},
+                having={"orders__ge": 3},
+            )
+        """
+        group_by = tuple(group_by or ())
+        metrics = {
+            alias: (spec[0], spec[1])
+            for alias, spec in (metrics or {"count": ("count", "*")}).items()
+        }
+        overlap = set(group_by) & set(metrics)
+        if overlap:
+            raise ValidationException(
+                errors=dict.fromkeys(overlap, "Metric name clashes with a group_by field"),
+                error_code=INVALID_QUERY,
+            )
+
+        where_shape, params = self._where_params(filter_options, search=True)
+        having_shape, having_params = self._having_params(having or {}, metrics)
+        key = (
+            "aggregate",
+            where_shape,
+            group_by,
+            tuple(metrics.items()),
+            having_shape,
+            self._sorting_key(filter_options.sorting),
+        )
+        query = self._cached(
+            key,
+            lambda: self._build_aggregate_query(
+                where_shape, group_by, metrics, having_shape, filter_options.sorting
+            ),
+        )
+        result = await self.session.execute(query, {**params, **having_params})
+        return [dict(row) for row in result.mappings()]
+
+    def statement_cache_info(self) -> dict[str, int]:
+        return get_statement_cache(self.model).stats()
+
+    async def _commit(self) -> None:
+        """Commit, or only flush when running inside a unit of work."""
+        if in_unit_of_work(self.session):
+            await self.session.flush()
+        else:
+            await self.session.commit()
 
     async def create(self, obj: ModelType) -> ModelType:
         session = self.session
         session.add(obj)
-        await session.commit()
-        await session.refresh(obj)
+        await self._commit()
+        await self._invalidate([obj.id])  # type: ignore[attr-defined]
         return obj
 
-    async def update_obj(self, where: dict[str, Any], values: dict[str, Any]) -> int:
+    def _bulk_rows(self, rows: Sequence[dict[str, Any] | BaseModel]) -> list[dict[str, Any]]:
+        return [
+            row.model_dump(exclude_unset=True) if isinstance(row, BaseModel) else row
+            for row in rows
+        ]
+
+    async def create_many(
+        self,
+        rows: Sequence[dict[str, Any] | BaseModel],
+        chunk_size: int | None = None,
+    ) -> list[ModelType]:
+        """Insert ``rows`` with multi-row ``INSERT ... RETURNING``, one statement per chunk."""
+        session = self.session
+        values = self._bulk_rows(rows)
+        chunk_size = chunk_size or settings.BULK_CHUNK_SIZE
+        statement = insert(self.model).returning(self.model)
+
+        created: list[ModelType] = []
+        for start in range(0, len(values), chunk_size):
+            result = await session.scalars(statement, values[start : start + chunk_size])
+            created.extend(result.all())
+        await self._commit()
+        await self._invalidate([obj.id for obj in created])  # type: ignore[attr-defined]
+        return created
+
+    async def upsert_many(
+        self,
+        rows: Sequence[dict[str, Any] | BaseModel],
+        conflict_target: Sequence[str],
+        update_fields: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> list[ModelType]:
+        """Insert ``rows`` or update the existing ones with ``INSERT ... ON CONFLICT DO UPDATE``.
+
+        Args:
+            rows (Sequence[dict[str, Any] | BaseModel]): Rows to write.
+            conflict_target (Sequence[str]): Columns of the unique index that decides a conflict.
+            update_fields (Sequence[str] | None): Columns overwritten on conflict. Defaults to
+                every column present in ``rows`` except the conflict target and ``id``.
+                JSON columns are merged into the stored value, as in ``update_obj``.
+            chunk_size (int | None): Rows per statement, ``BULK_CHUNK_SIZE`` by default.
+
+        Returns:
+            list[ModelType]: The inserted or updated rows.
+        """
+        session = self.session
+        values = self._bulk_rows(rows)
+        if not values:
+            return []
+        chunk_size = chunk_size or settings.BULK_CHUNK_SIZE
+
+        index_elements = [self.metadata.field(name).column for name in conflict_target]
+        if update_fields is None:
+            present = dict.fromkeys(key for row in values for key in row)
+            update_fields = [key for key in present if key not in conflict_target and key != "id"]
+
+        statement = pg_insert(self.model)
+        set_values: dict[str, Any] = {}
+        for key in update_fields:
+            column = self.metadata.field(key).column
+            if isinstance(column.type, JSON):
+                set_values[key] = cast(column, JSONB).concat(cast(statement.excluded[key], JSONB))
+            else:
+                set_values[key] = statement.excluded[key]
+        # ON CONFLICT DO UPDATE does not fire Python-side onupdate defaults
+        if "updated_at" in self.metadata.fields and "updated_at" not in set_values:
+            set_values["updated_at"] = func.now()
+
+        statement = (
+            statement.on_conflict_do_update(index_elements=index_elements, set_=set_values)
+            if set_values
+            else statement.on_conflict_do_nothing(index_elements=index_elements)
+        )
+        returning = statement.returning(self.model).execution_options(populate_existing=True)
+
+        written: list[ModelType] = []
+        for start in range(0, len(values), chunk_size):
+            result = await session.scalars(returning, values[start : start + chunk_size])
+            written.extend(result.all())
+        await self._commit()
+        await self._invalidate([obj.id for obj in written])  # type: ignore[attr-defined]
+        return written
+
+    async def _write_in_chunks(
+        self,
+        statement: Any,
+        condition: Any,
+        chunk_size: int,
+        pause: float | None = None,
+    ) -> int:
+        """Apply an ``UPDATE``/``DELETE`` to rows matching ``condition`` in id order.
+
+        Each chunk takes the next ``chunk_size`` ids past the previous chunk, writes them
+        and commits, so no transaction holds more than ``chunk_size`` row locks or WAL for
+        more rows than that. Rows that stop matching after being written are never visited
+        twice, since the seek is on ``id`` alone.
+
+        Inside a unit of work chunks are only flushed: the caller's single commit still
+        covers every chunk, so only the statements (not the transaction) are bounded.
+        """
+        id_column = self.model.id  # type: ignore[attr-defined]
+        pause = settings.DB_WRITE_CHUNK_PAUSE if pause is None else pause
+        total = 0
+        last_id = None
+        while True:
+            ids = select(id_column).where(condition).order_by(id_column).limit(chunk_size)
+            if last_id is not None:
+                ids = ids.where(id_column > last_id)
+            chunk = statement.where(id_column.in_(ids)).returning(id_column)
+            written = (
+                (
+                    await self.session.execute(
+                        chunk, execution_options={"synchronize_session": False}
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            if not written:
+                break
+            await self._commit()
+            await self._invalidate(written)
+            total += len(written)
+            last_id = max(written)
+            if len(written) < chunk_size:
+                break
+            if pause:
+                await asyncio.sleep(pause)
+        return total
+
+    async def update_obj(
+        self,
+        where: dict[str, Any],
+        values: dict[str, Any],
+        chunk_size: int | None = None,
+        pause: float | None = None,
+    ) -> int:
+        """Update rows matching ``where``; JSON values are merged into the stored value.
+
+        With ``chunk_size`` the rows are updated ``chunk_size`` at a time in id order with a
+        commit (and ``pause`` seconds, ``DB_WRITE_CHUNK_PAUSE`` by default) after each
+        chunk, instead of in one statement and transaction. Inside a unit of work the
+        chunks share its transaction.
+        """
         session = self.session
         filters = self._build_filters(where)
 
@@ -255,9 +1142,13 @@ class BaseRepository(Generic[ModelType]):  # noqa: UP046
             else:
                 update_values[key] = value
 
-        query = update(self.model).where(and_(True, *filters)).values(**update_values)
-        result = await session.execute(query)
-        await session.commit()
+        query = update(self.model).values(**update_values)
+        if chunk_size:
+            return await self._write_in_chunks(query, and_(True, *filters), chunk_size, pause)
+
+        result = await session.execute(query.where(and_(True, *filters)))
+        await self._commit()
+        await self._invalidate(self._filtered_ids(where))
         return result.rowcount
 
     async def create_and_update(
@@ -271,32 +1162,86 @@ class BaseRepository(Generic[ModelType]):  # noqa: UP046
 
         for key, value in list(update_values.items()):
             if isinstance(value, dict) and isinstance(getattr(self.model, key).type, JSON):
-                update_values[key] = cast(getattr(self.model, key), JSON).concat(cast(value, JSON))
+                update_values[key] = cast(getattr(self.model, key), JSONB).concat(
+                    cast(value, JSONB)
+                )
 
-        query = select(self.model).where(and_(*filters))
-        existing_obj = await session.execute(query)
-        existing_obj = existing_obj.scalars().first()  # type:ignore
+        live = self._live(include_deleted=False)
+        if live is not None:
+            filters.append(live)
+        query = select(self.model).where(and_(True, *filters))
+        existing_obj = (await session.execute(query)).scalars().first()
 
         if existing_obj:
             for key, value in update_values.items():
                 setattr(existing_obj, key, value)
             session.add(existing_obj)
-            await session.commit()
-            await session.refresh(existing_obj)
-            return existing_obj  # type:ignore
+            await self._commit()
+            await self._invalidate([existing_obj.id])  # type: ignore[attr-defined]
+            # Merged JSON columns are SQL expressions, so only those need reading back
+            merged = [
+                key for key, value in update_values.items() if isinstance(value, ColumnElement)
+            ]
+            if merged:
+                await session.refresh(existing_obj, attribute_names=merged)
+            return existing_obj
 
         new_obj = self.model(**update_values)
         session.add(new_obj)
-        await session.commit()
-        await session.refresh(new_obj)
+        await self._commit()
+        await self._invalidate([new_obj.id])  # type: ignore[attr-defined]
         return new_obj
 
-    async def delete(self, filter_options: FilterOptions) -> int:
+    async def delete(
+        self,
+        filter_options: FilterOptions,
+        chunk_size: int | None = None,
+        pause: float | None = None,
+        hard: bool = False,
+    ) -> int:
+        """Delete rows matching ``filter_options`` and return how many were deleted.
+
+        Models with :class:`SoftDeleteMixin` only get ``deleted_at`` set on rows not yet
+        deleted, unless ``hard`` is true. ``chunk_size`` and ``pause`` work as in
+        ``update_obj``.
+        """
         session = self.session
-        filters = self._build_filters(filter_options.filters)
+        condition = and_(True, *self._build_filters(filter_options.filters))
 
-        query = delete(self.model).where(and_(*filters))
-        result = await session.execute(query)
-        await session.commit()
+        query: Any
+        if self.soft_delete and not hard:
+            condition = and_(condition, self._live(include_deleted=False))
+            query = update(self.model).values(deleted_at=func.now())
+        else:
+            query = delete(self.model)
+        if chunk_size:
+            return await self._write_in_chunks(query, condition, chunk_size, pause)
+
+        result = await session.execute(query.where(condition))
+        await self._commit()
+        await self._invalidate(self._filtered_ids(filter_options.filters))
 
         return result.rowcount  # Number of rows deleted
+
+    async def purge_deleted(
+        self,
+        retention: timedelta | None = None,
+        chunk_size: int | None = None,
+        pause: float | None = None,
+    ) -> int:
+        """Hard-delete rows soft-deleted more than ``retention`` ago, in chunks.
+
+        ``retention`` defaults to ``SOFT_DELETE_RETENTION_DAYS`` and ``chunk_size`` to
+        ``DB_WRITE_CHUNK_SIZE``.
+        """
+        if not self.soft_delete:
+            return 0
+        if retention is None:
+            retention = timedelta(days=settings.SOFT_DELETE_RETENTION_DAYS)
+        deleted_at = self.model.deleted_at  # type: ignore[attr-defined]
+        return await self._write_in_chunks(
+            delete(self.model),
+            deleted_at < func.now() - retention,
+            chunk_size or settings.DB_WRITE_CHUNK_SIZE,
+            pause,
+        )
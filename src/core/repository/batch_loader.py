@@ -0,0 +1,140 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+BATCH_LOADER_KEY = "batch_loader"
+
+# (model, lookup) pairs; invalidation works per model
+BatchKey = tuple[type, Hashable]
+Fetch = Callable[[list[Any]], Awaitable[dict[Any, Any]]]
+
+
+class BatchLoader:
+    """Request-scoped loader that merges lookups made in the same event-loop tick.
+
+    Every key requested for a batch key before the loop gets back to the loader is
+    fetched with one ``fetch(keys)`` call (typically ``WHERE id IN (...)``); duplicate keys
+    share one result and results are cached until a write to the model invalidates them.
+    Lookups only coalesce when they run concurrently, e.g. under ``asyncio.gather``.
+
+    All batches go through one dispatcher task that runs their fetches one at a time,
+    since they share the request's session, which cannot run statements concurrently.
+    """
+
+    def __init__(self) -> None:
+        self.loads = 0
+        self.cache_hits = 0
+        self.deduplicated = 0
+        self.batches = 0
+        self.batched_keys = 0
+        self._cache: dict[BatchKey, dict[Any, Any]] = {}
+        self._pending: dict[BatchKey, tuple[Fetch, dict[Any, asyncio.Future[Any]]]] = {}
+        self._generations: dict[type, int] = {}
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    async def load(self, batch_key: BatchKey, key: Any, fetch: Fetch) -> Any:
+        self.loads += 1
+        cache = self._cache.get(batch_key)
+        if cache is not None and key in cache:
+            self.cache_hits += 1
+            return cache[key]
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(batch_key)
+        if pending is None:
+            pending = self._pending[batch_key] = (fetch, {})
+            if self._dispatcher is None:
+                self._dispatcher = loop.create_task(self._dispatch())
+
+        futures = pending[1]
+        future = futures.get(key)
+        if future is None:
+            future = futures[key] = loop.create_future()
+        else:
+            self.deduplicated += 1
+        return await future
+
+    async def _dispatch(self) -> None:
+        """Fetch pending batches in turn, including any queued while one was running."""
+        try:
+            while self._pending:
+                batch_key = next(iter(self._pending))
+                await self._fetch_batch(batch_key, *self._pending.pop(batch_key))
+        except asyncio.CancelledError:
+            for _fetch, futures in self._pending.values():
+                for future in futures.values():
+                    future.cancel()
+            self._pending.clear()
+            raise
+        finally:
+            self._dispatcher = None
+
+    async def _fetch_batch(
+        self, batch_key: BatchKey, fetch: Fetch, futures: dict[Any, asyncio.Future[Any]]
+    ) -> None:
+        model = batch_key[0]
+        generation = self._generations.get(model, 0)
+        self.batches += 1
+        self.batched_keys += len(futures)
+        try:
+            results = await fetch(list(futures))
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+        except Exception as exc:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        # A write during the fetch may have changed rows it read, so only cache if none did
+        if self._generations.get(model, 0) == generation:
+            self._cache.setdefault(batch_key, {}).update(results)
+        for key, future in futures.items():
+            if not future.done():
+                future.set_result(results.get(key))
+
+    def invalidate(self, model: type) -> None:
+        self._generations[model] = self._generations.get(model, 0) + 1
+        for batch_key in [batch_key for batch_key in self._cache if batch_key[0] is model]:
+            del self._cache[batch_key]
+
+    def stats(self) -> dict[str, int]:
+        """Per-request counters: ``loads`` lookups were served by ``batches`` queries."""
+        return {
+            "loads": self.loads,
+            "cache_hits": self.cache_hits,
+            "deduplicated": self.deduplicated,
+            "batches": self.batches,
+            "batched_keys": self.batched_keys,
+        }
+
+
+def get_batch_loader(session: AsyncSession | Session) -> BatchLoader:
+    """Return the loader of ``session``; with ``get_db`` that is one per request."""
+    loader = session.info.get(BATCH_LOADER_KEY)
+    if loader is None:
+        loader = session.info[BATCH_LOADER_KEY] = BatchLoader()
+    return loader
+
+
+def invalidate_batch_loader(session: AsyncSession | Session, models: Iterable[type]) -> None:
+    loader = session.info.get(BATCH_LOADER_KEY)
+    if loader is not None:
+        for model in models:
+            loader.invalidate(model)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed(session: Session, _flush_context: Any) -> None:
+    """Drop cached lookups of models written through the ORM in this session."""
+    if BATCH_LOADER_KEY in session.info:
+        models = {
+            inspect(obj).mapper.class_ for obj in (*session.new, *session.dirty, *session.deleted)
+        }
+        invalidate_batch_loader(session, models)
@@ -0,0 +1,86 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+from typing import Any
+from uuid import UUID
+
+from src.core.error.codes import INVALID_QUERY
+from src.core.error.exceptions import ValidationException
+
+SortSpec = list[tuple[str, str]]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, time):
+        return {"t": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decoders = {
+        "dt": datetime.fromisoformat,
+        "d": date.fromisoformat,
+        "t": time.fromisoformat,
+        "dec": Decimal,
+        "uuid": UUID,
+    }
+    ((tag, raw),) = value.items()
+    return decoders[tag](raw)
+
+
+def encode_cursor(sort_spec: SortSpec, values: list[Any]) -> str:
+    """Encode the sort key of a row into an opaque cursor.
+
+    Args:
+        sort_spec (SortSpec): Ordered ``(field, direction)`` pairs the page was sorted by.
+        values (list[Any]): The row's values for each field in ``sort_spec``.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    payload = {"s": sort_spec, "v": [_encode_value(value) for value in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, sort_spec: SortSpec) -> list[Any]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor sent by the client.
+        sort_spec (SortSpec): The sort order of the current request.
+
+    Raises:
+        ValidationException: If the cursor is malformed or was issued for a different sorting.
+
+    Returns:
+        list[Any]: The sort key values, in ``sort_spec`` order.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        issued_for = [tuple(item) for item in payload["s"]]
+        values = [_decode_value(value) for value in payload["v"]]
+    except (binascii.Error, ValueError, KeyError, TypeError, InvalidOperation) as exc:
+        raise ValidationException(
+            errors={"cursor": "Malformed cursor"}, error_code=INVALID_QUERY
+        ) from exc
+
+    if issued_for != sort_spec or len(values) != len(sort_spec):
+        raise ValidationException(
+            errors={"cursor": "Cursor does not match the requested sorting"},
+            error_code=INVALID_QUERY,
+        )
+    return values
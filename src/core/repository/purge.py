@@ -0,0 +1,35 @@
+import asyncio
+from datetime import timedelta
+
+from src.core.config import settings
+from src.core.db.connection import async_session
+from src.core.logger import logger
+from src.core.models.soft_delete import soft_delete_models
+from src.core.repository.base import BaseRepository
+
+
+async def purge_soft_deleted(retention: timedelta | None = None) -> dict[str, int]:
+    """Hard-delete expired soft-deleted rows of every :class:`SoftDeleteMixin` model.
+
+    Returns:
+        dict[str, int]: Rows purged per model name.
+    """
+    purged: dict[str, int] = {}
+    for model in soft_delete_models():
+        async with async_session() as session:
+            purged[model.__name__] = await BaseRepository(model, session).purge_deleted(retention)
+    return purged
+
+
+async def run_purge_task(interval: float | None = None) -> None:
+    """Purge every ``interval`` seconds (``SOFT_DELETE_PURGE_INTERVAL``) until cancelled."""
+    interval = interval or settings.SOFT_DELETE_PURGE_INTERVAL
+    while True:
+        try:
+            purged = await purge_soft_deleted()
+        except Exception:
+            logger.exception("Purging soft-deleted rows failed")
+        else:
+            if any(purged.values()):
+                logger.info("Purged soft-deleted rows: %s", purged)
+        await asyncio.sleep(interval)
@@ -0,0 +1,221 @@
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from time import monotonic
+from typing import Any, Protocol
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from src.core.config import settings
+from src.core.schemas.common import FilterOptions
+
+MISSING: Any = object()
+
+
+class CacheBackend(Protocol):
+    """Storage used by :class:`ResultCache`; ``get`` returns ``MISSING`` on a miss."""
+
+    async def get(self, key: str) -> Any: ...
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def incr(self, key: str) -> int: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+
+class InMemoryCacheBackend:
+    """Process-local LRU with per-entry TTL."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self._entries[key] = (monotonic() + ttl if ttl is not None else None, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        # Generation counters must not be evicted, so they bypass the LRU
+        value = await self.get(key)
+        value = 1 if value is MISSING else value + 1
+        self._entries[key] = (None, value)
+        return value
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+def options_digest(filter_options: FilterOptions) -> str:
+    """Stable digest of ``filter_options``, independent of dict and set ordering."""
+    data = filter_options.model_dump(mode="json")
+    if data.get("or_filters"):
+        data["or_filters"] = sorted(data["or_filters"])
+    raw = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """Query result cache with generation-based invalidation and single-flight loads.
+
+    Every key embeds the model's generation, list queries also its list generation and
+    ``get_by_id`` entries the row's generation. Writes bump the matching counters, so
+    stale entries are never read again and simply age out of the LRU:
+
+    - writes to known rows bump those rows and the list generation;
+    - writes to unknown rows bump the model generation, dropping everything.
+    """
+
+    def __init__(self, backend: CacheBackend) -> None:
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    async def _generation(self, key: str) -> int:
+        value = await self.backend.get(key)
+        return 0 if value is MISSING else int(value)
+
+    async def _settle_invalidations(self) -> None:
+        # Invalidations scheduled by a flush must land before the next key is computed
+        if _background_tasks:
+            await asyncio.gather(*_background_tasks)
+
+    async def list_key(self, model: type, kind: str, digest: str) -> str:
+        await self._settle_invalidations()
+        name = model.__name__
+        generation = await self._generation(f"{name}:gen")
+        list_generation = await self._generation(f"{name}:listgen")
+        return f"{name}:{generation}:{kind}:{list_generation}:{digest}"
+
+    async def row_key(self, model: type, obj_id: Any, digest: str) -> str:
+        await self._settle_invalidations()
+        name = model.__name__
+        generation = await self._generation(f"{name}:gen")
+        row_generation = await self._generation(f"{name}:row:{obj_id}")
+        return f"{name}:{generation}:id:{obj_id}:{row_generation}:{digest}"
+
+    async def get_or_load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Any]],
+        ttl: float | None,
+    ) -> Any:
+        """Return the cached value of ``key`` or load it, sharing one load between callers."""
+        value = await self.backend.get(key)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await load()
+            await self.backend.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # waiters re-raise it; mark it retrieved when there are none
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def invalidate(self, model: type, ids: Iterable[Any] | None = None) -> None:
+        name = model.__name__
+        if ids is None:
+            await self.backend.incr(f"{name}:gen")
+            return
+        for obj_id in ids:
+            await self.backend.incr(f"{name}:row:{obj_id}")
+        await self.backend.incr(f"{name}:listgen")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "backend": self.backend.stats(),
+        }
+
+
+result_cache = ResultCache(InMemoryCacheBackend(settings.RESULT_CACHE_MAX_ENTRIES))
+
+
+def configure_result_cache(backend: CacheBackend) -> None:
+    """Swap the backend of the shared result cache, e.g. for a Redis implementation."""
+    result_cache.backend = backend
+
+
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed(session: Session, _flush_context: Any) -> None:
+    """Invalidate rows written through the ORM directly instead of repository methods.
+
+    Flush runs synchronously, so the invalidation is scheduled on the running loop; cache
+    keys are computed only after it has landed.
+
+    Inserted objects get their identity only after this hook, so their id is read from
+    the primary key the flush filled in. A model is recorded even when no id is known,
+    which still bumps its list generation.
+    """
+    changed: dict[type, set[Any]] = {}
+    for obj in session.new:
+        state = inspect(obj)
+        ids = changed.setdefault(type(obj), set())
+        primary_key = state.mapper.primary_key_from_instance(obj)
+        if len(primary_key) == 1 and primary_key[0] is not None:
+            ids.add(primary_key[0])
+    for obj in (*session.dirty, *session.deleted):
+        identity = inspect(obj).identity
+        if identity is not None:
+            changed.setdefault(type(obj), set()).add(identity[0])
+    if not changed:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    for model, ids in changed.items():
+        task = loop.create_task(result_cache.invalidate(model, ids))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
@@ -0,0 +1,125 @@
+from collections.abc import Sequence
+from functools import reduce
+from typing import Any
+
+from sqlalchemy import DDL, Index, Table, event, func, literal_column, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class SearchBackend:
+    """How ``paginate_filters`` turns ``QueryParams.search`` into SQL.
+
+    A model picks its backend with a ``__search_backend__`` class attribute. Backends
+    given ``columns`` always search those; otherwise they search the request's
+    ``search_fields``.
+    """
+
+    # Whether ``rank`` orders results by relevance when no explicit sorting is given
+    ranked = False
+
+    def __init__(self, columns: Sequence[str] | None = None) -> None:
+        self.columns = tuple(columns) if columns else None
+
+    def fields(self, search_fields: Sequence[str] | None) -> tuple[str, ...] | None:
+        return self.columns or (tuple(search_fields) if search_fields else None)
+
+    def bind_value(self, term: str) -> Any:
+        return term
+
+    def condition(self, columns: Sequence[Any], term: Any) -> ColumnElement[bool]:
+        raise NotImplementedError
+
+    def rank(self, columns: Sequence[Any], term: Any) -> ColumnElement[Any] | None:  # noqa: ARG002
+        return None
+
+    def declare_indexes(self, table: Table) -> None:
+        """Attach the indexes this backend needs to ``table``."""
+
+
+class IlikeSearch(SearchBackend):
+    """``column ILIKE '%term%'`` on each field; needs no index but scans the table."""
+
+    def bind_value(self, term: str) -> Any:
+        return f"%{term}%"
+
+    def condition(self, columns: Sequence[Any], term: Any) -> ColumnElement[bool]:
+        return or_(*(column.ilike(term) for column in columns))
+
+
+class PostgresFullTextSearch(SearchBackend):
+    """``tsvector @@ websearch_to_tsquery`` over the concatenated fields, ranked by ``ts_rank``.
+
+    The document expression is built identically for queries and for the GIN index, so
+    Postgres can answer searches from the index. That requires fixed ``columns``.
+    """
+
+    ranked = True
+
+    def __init__(self, columns: Sequence[str], config: str = "simple") -> None:
+        super().__init__(columns)
+        if not config.isidentifier():
+            raise ValueError(f"Invalid text search configuration {config!r}")
+        self.config = config
+
+    def _config(self) -> Any:
+        # Inlined rather than bound: an index expression only matches literal constants
+        return literal_column(f"'{self.config}'::regconfig")
+
+    @staticmethod
+    def _join(left: ColumnElement[Any], right: ColumnElement[Any]) -> ColumnElement[Any]:
+        return left.op("||")(literal_column("' '")).op("||")(right)
+
+    def document(self, columns: Sequence[Any]) -> ColumnElement[Any]:
+        parts: list[ColumnElement[Any]] = [
+            func.coalesce(column, literal_column("''")) for column in columns
+        ]
+        return func.to_tsvector(self._config(), reduce(self._join, parts))
+
+    def _query(self, term: Any) -> ColumnElement[Any]:
+        return func.websearch_to_tsquery(self._config(), term)
+
+    def condition(self, columns: Sequence[Any], term: Any) -> ColumnElement[bool]:
+        return self.document(columns).bool_op("@@")(self._query(term))
+
+    def rank(self, columns: Sequence[Any], term: Any) -> ColumnElement[Any] | None:
+        return func.ts_rank(self.document(columns), self._query(term))
+
+    def declare_indexes(self, table: Table) -> None:
+        columns = [table.c[name] for name in self.columns or ()]
+        table.append_constraint(
+            Index(f"ix_{table.name}_fts", self.document(columns), postgresql_using="gin")
+        )
+
+
+class TrigramSearch(SearchBackend):
+    """``pg_trgm`` similarity (``column % term``) on each field, ranked by ``similarity``.
+
+    Each field gets a ``gin_trgm_ops`` index, which also speeds up ILIKE on it. The
+    match cut-off is Postgres' ``pg_trgm.similarity_threshold`` setting.
+    """
+
+    ranked = True
+
+    def condition(self, columns: Sequence[Any], term: Any) -> ColumnElement[bool]:
+        return or_(*(column.bool_op("%")(term) for column in columns))
+
+    def rank(self, columns: Sequence[Any], term: Any) -> ColumnElement[Any] | None:
+        similarities = [func.similarity(column, term) for column in columns]
+        return similarities[0] if len(similarities) == 1 else func.greatest(*similarities)
+
+    def declare_indexes(self, table: Table) -> None:
+        event.listen(table, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for name in self.columns or ():
+            Index(
+                f"ix_{table.name}_{name}_trgm",
+                table.c[name],
+                postgresql_using="gin",
+                postgresql_ops={name: "gin_trgm_ops"},
+            )
+
+
+ILIKE_SEARCH = IlikeSearch()
+
+
+def get_search_backend(model: type) -> SearchBackend:
+    return getattr(model, "__search_backend__", None) or ILIKE_SEARCH
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any
+
+from src.core.config import settings
+
+
+class StatementCache:
+    """Bounded LRU of parameterized statements, keyed by query shape.
+
+    Statements are built with ``bindparam`` placeholders in place of filter values, so
+    a cached entry serves every request of the same shape and only the parameter dict
+    changes. SQLAlchemy's own compiled cache then recognises the identical statement
+    and skips recompilation as well.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            statement = self._entries.get(key)
+            if statement is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return statement
+            self.misses += 1
+
+        statement = build()
+        with self._lock:
+            self._entries[key] = statement
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return statement
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_statement_caches: dict[type, StatementCache] = {}
+
+
+def get_statement_cache(model: type) -> StatementCache:
+    """Return the statement cache of ``model``, creating it on first use."""
+    cache = _statement_caches.get(model)
+    if cache is None:
+        cache = _statement_caches.setdefault(model, StatementCache(settings.STATEMENT_CACHE_SIZE))
+    return cache
+
+
+def statement_cache_stats() -> dict[str, dict[str, int]]:
+    return {model.__name__: cache.stats() for model, cache in _statement_caches.items()}
@@ -0,0 +1,106 @@
+import secrets
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import PlainTextResponse
+from src.core.config import settings
+from src.core.db.pool_metrics import pool_stats
+from src.core.error.exceptions import UnauthorizedException
+from src.core.helpers.metrics import PrometheusText
+from src.core.middleware.instrumentation import route_metrics
+from src.core.repository.result_cache import result_cache
+from src.core.repository.statement_cache import statement_cache_stats
+
+
+def verify_metrics_token(authorization: Annotated[str | None, Header()] = None) -> None:
+    """Require ``Authorization: Bearer <INTERNAL_METRICS_TOKEN>`` when a token is configured."""
+    token = settings.INTERNAL_METRICS_TOKEN
+    if token is None:
+        return
+    scheme, _, credentials = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(
+        credentials.encode(), token.encode()
+    ):
+        raise UnauthorizedException()
+
+
+router = APIRouter(
+    prefix="/internal/metrics",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(verify_metrics_token)],
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("")
+async def prometheus_metrics() -> PlainTextResponse:
+    text = PrometheusText()
+
+    for (method, path), metrics in route_metrics.items():
+        labels = {"method": method, "route": path}
+        text.add_histogram(
+            "http_request_duration_seconds", "Request latency.", metrics.latency, labels
+        )
+        for status_code, count in metrics.responses.items():
+            text.add(
+                "http_responses_total",
+                "counter",
+                "Responses by status code.",
+                count,
+                {**labels, "status": str(status_code)},
+            )
+        text.add(
+            "http_request_sql_statements_total",
+            "counter",
+            "SQL statements executed while handling requests.",
+            metrics.sql_statements,
+            labels,
+        )
+        text.add(
+            "http_request_sql_seconds_total",
+            "counter",
+            "Time spent in SQL statements while handling requests.",
+            metrics.sql_seconds,
+            labels,
+        )
+
+    for pool_name, stats in pool_stats().items():
+        labels = {"pool": pool_name}
+        for key in ("size", "in_use", "idle", "overflow"):
+            if key in stats:
+                text.add(f"db_pool_{key}", "gauge", f"Connection pool {key}.", stats[key], labels)
+        for key in ("checkouts", "connects", "invalidations", "timeouts"):
+            text.add(
+                f"db_pool_{key}_total", "counter", f"Connection pool {key}.", stats[key], labels
+            )
+
+    for cache_name, stats in statement_cache_stats().items():
+        for key in ("hits", "misses", "evictions"):
+            text.add(
+                f"statement_cache_{key}_total",
+                "counter",
+                f"Statement cache {key}.",
+                stats[key],
+                {"model": cache_name},
+            )
+
+    for key in ("hits", "misses", "coalesced"):
+        text.add(
+            f"result_cache_{key}_total",
+            "counter",
+            f"Result cache {key}.",
+            result_cache.stats()[key],
+        )
+
+    return PlainTextResponse(text.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/db")
+async def db_metrics() -> dict[str, Any]:
+    return {
+        "pools": pool_stats(),
+        "statement_cache": statement_cache_stats(),
+        "result_cache": result_cache.stats(),
+    }
@@ -1,10 +1,12 @@
 from collections.abc import Sequence
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Literal, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 T = TypeVar("T")
 
+CountStrategy = Literal["exact", "exact_window", "estimated", "none"]
+
 
 class QueryParams(BaseModel):
     page: int = Field(1, ge=1, description="The page number to retrieve")
@@ -12,6 +14,27 @@ class QueryParams(BaseModel):
     search: str | None = Field(None, description="The search query")
     filter_params: dict[str, Any] | None = None
     sorting: dict[str, str] | None = None
+    after: str | None = Field(None, description="Cursor of the row to start after")
+    before: str | None = Field(None, description="Cursor of the row to end before")
+    fields: str | None = Field(
+        None, description="Comma-separated fields to return, e.g. id,name,price"
+    )
+
+    @model_validator(mode="after")
+    def _check_cursors(self) -> "QueryParams":
+        if self.after and self.before:
+            raise ValueError("Only one of after and before may be set")
+        return self
+
+    @property
+    def is_cursor(self) -> bool:
+        return bool(self.after or self.before)
+
+    @property
+    def field_set(self) -> tuple[str, ...] | None:
+        if not self.fields:
+            return None
+        return tuple(name for name in (part.strip() for part in self.fields.split(",")) if name)
 
     @property
     def skip(self) -> int:
@@ -27,20 +50,35 @@ class FilterOptions(BaseModel):
     search_fields: list[str] | None = None
     sorting: dict[str, str] | None = None
     prefetch: tuple[str, ...] | None = None
+    # Raise on lazy loads of relationships not in prefetch; None uses DB_STRICT_LOADING
+    strict_loading: bool | None = None
+    # Fields to load, e.g. pagination.field_set; row_mode returns dicts instead of entities
+    projection: tuple[str, ...] | None = None
+    row_mode: bool = False
+    # Also return rows soft-deleted through SoftDeleteMixin
+    include_deleted: bool = False
 
     use_or: bool = False
     distinct_on: str | None = None
     # raw_query: str | None = None
     or_filters: set[str] | None = None
 
+    # exact: separate COUNT(*); exact_window: COUNT(*) OVER () in the page query;
+    # estimated: planner estimate once it exceeds the threshold; none: no total at all
+    count_strategy: CountStrategy = "exact"
+    estimated_count_threshold: int = 10_000
+
 
 class PaginationMeta(BaseModel):
-    total: int
+    total: int | None
     current_page: int
     next_page: int | None
     prev_page: int | None
-    last_page: int
+    last_page: int | None
     page_size: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    count_strategy: CountStrategy = "exact"
     extra: Any | None = None
 
 
@@ -1,4 +1,7 @@
+import hashlib
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
+from time import time
 from typing import Any, Literal
 
 import jwt
@@ -8,17 +11,104 @@ from src.core.logger import logger
 from src.modules.auth.schemas import AccessTokenPayload, RefreshTokenPayload
 
 
+class VerifiedTokenCache:
+    """LRU of verified token payloads, keyed by the SHA-256 digest of the token.
+
+    Entries are dropped once the token's ``exp`` has passed, so a cached token is never
+    accepted for longer than ``jwt.decode`` would accept it.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = self._digest(token)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(entry[1])
+
+    def set(self, token: str, payload: dict[str, Any]) -> None:
+        if self.maxsize <= 0 or "exp" not in payload:
+            return
+        self._entries[self._digest(token)] = (float(payload["exp"]), dict(payload))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _read_key(value: str) -> str:
+    if value.lstrip().startswith("-----BEGIN"):
+        return value
+    with open(value, encoding="utf-8") as key_file:
+        return key_file.read()
+
+
+def load_keys(algorithm: str) -> tuple[Any, Any]:
+    """Return the ``(signing, verification)`` keys for ``algorithm``, parsed once.
+
+    HMAC algorithms use ``SECRET_KEY`` for both. Asymmetric ones parse the configured
+    PEM keys up front so no request pays for it; the public key is derived from the
+    private one when only that is set.
+    """
+    if algorithm.startswith("HS"):
+        return settings.SECRET_KEY, settings.SECRET_KEY
+    try:
+        prepare_key = jwt.get_algorithm_by_name(algorithm).prepare_key
+    except NotImplementedError as exception:
+        raise RuntimeError(
+            f"JWT algorithm {algorithm} requires the cryptography package (pyjwt[crypto])"
+        ) from exception
+
+    private_key = (
+        prepare_key(_read_key(settings.JWT_PRIVATE_KEY)) if settings.JWT_PRIVATE_KEY else None
+    )
+    if settings.JWT_PUBLIC_KEY:
+        public_key = prepare_key(_read_key(settings.JWT_PUBLIC_KEY))
+    elif private_key is not None:
+        public_key = private_key.public_key()
+    else:
+        raise RuntimeError(f"JWT algorithm {algorithm} requires JWT_PUBLIC_KEY or JWT_PRIVATE_KEY")
+    return private_key, public_key
+
+
 class JWTHandler:
     secret_key = settings.SECRET_KEY
     algorithm = settings.JWT_ALGORITHM
     access_expire_minutes = settings.ACCESS_TOKEN_EXPIRY_MINUTES
     refresh_expire_minutes = settings.REFRESH_TOKEN_EXPIRY_MINUTES
+    signing_key, verification_key = load_keys(settings.JWT_ALGORITHM)
+    cache = VerifiedTokenCache(settings.JWT_CACHE_SIZE)
 
     @staticmethod
     def encode(
         token_type: Literal["access", "refresh"],
         payload: AccessTokenPayload | RefreshTokenPayload,
     ) -> tuple[str, datetime]:
+        if JWTHandler.signing_key is None:
+            raise RuntimeError("JWT_PRIVATE_KEY is required to issue tokens")
         expire_minutes = (
             JWTHandler.access_expire_minutes
             if token_type == "access"
@@ -27,26 +117,33 @@ class JWTHandler:
         expire = datetime.now(UTC) + timedelta(minutes=expire_minutes)
         payload.exp = expire
         return str(
-            jwt.encode(payload.model_dump(), JWTHandler.secret_key, algorithm=JWTHandler.algorithm)
+            jwt.encode(payload.model_dump(), JWTHandler.signing_key, algorithm=JWTHandler.algorithm)
         ), expire
 
     @staticmethod
     def decode(token: str) -> Any:
+        cached = JWTHandler.cache.get(token)
+        if cached is not None:
+            return cached
         try:
-            return jwt.decode(token, JWTHandler.secret_key, algorithms=[JWTHandler.algorithm])
+            payload = jwt.decode(
+                token, JWTHandler.verification_key, algorithms=[JWTHandler.algorithm]
+            )
         except jwt.PyJWTError as exception:
             logger.error("JWT invalid %s", exception)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired access token. Please log in again.",
             ) from exception
+        JWTHandler.cache.set(token, payload)
+        return payload
 
     @staticmethod
     def decode_expired(token: str) -> Any:
         try:
             return jwt.decode(
                 token,
-                JWTHandler.secret_key,
+                JWTHandler.verification_key,
                 algorithms=[JWTHandler.algorithm],
                 options={"verify_exp": False},
             )
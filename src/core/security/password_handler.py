@@ -1,13 +1,34 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
+from src.core.config import settings
 from src.core.logger import logger
 
 
 class PasswordHandler:
+    """bcrypt hashing with async variants that keep the event loop free.
+
+    The async methods run bcrypt on a small dedicated thread pool. Its size caps how many
+    hashes run at once; further calls wait in the pool's queue instead of competing for
+    CPU with request handling.
+    """
+
+    rounds = settings.BCRYPT_ROUNDS
+    _executor: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+            )
+        return cls._executor
+
     @staticmethod
     def hash(password: str) -> str:
-        # Implement password hashing logic here
         pwd_bytes = password.encode("utf-8")
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=PasswordHandler.rounds)
         hashed_password = bcrypt.hashpw(password=pwd_bytes, salt=salt)
         return str(hashed_password.decode("utf-8"))
 
@@ -20,3 +41,38 @@ class PasswordHandler:
         except Exception as err:  # pylint: disable=broad-except
             logger.error("PasswordHandler Exception verify_password %s", err)
             return False
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """Whether ``hashed_password`` was made with a different cost than configured."""
+        try:
+            return int(hashed_password.split("$")[2]) != PasswordHandler.rounds
+        except (IndexError, ValueError):
+            return True
+
+    @classmethod
+    async def hash_async(cls, password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls.executor(), cls.hash, password)
+
+    @classmethod
+    async def verify_password_async(cls, plain_password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            cls.executor(), cls.verify_password, plain_password, hashed_password
+        )
+
+    @classmethod
+    async def verify_and_rehash(
+        cls, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Verify a login and return a new hash when the stored cost is outdated.
+
+        Returns ``(verified, new_hash)``; ``new_hash`` is ``None`` unless the password
+        matched and the caller should store the replacement.
+        """
+        if not await cls.verify_password_async(plain_password, hashed_password):
+            return False, None
+        if not cls.needs_rehash(hashed_password):
+            return True, None
+        return True, await cls.hash_async(plain_password)
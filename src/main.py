@@ -1,12 +1,36 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from src.core.config import settings
+from src.core.helpers.serialization import FastJSONResponse
+from src.core.middleware.instrumentation import InstrumentationMiddleware
+from src.core.repository.purge import run_purge_task
+from src.core.routers.metrics import router as metrics_router
+from src.modules.catalog.routers import router as catalog_router
+from src.modules.inventory.tasks import run_sweeper_task
 from starlette.middleware.cors import CORSMiddleware
 
 from core.middleware.error_handler import CustomErrorMiddleware
 from core.middleware.validation import validation_exception_handler
 
 
+@contextlib.asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    tasks = []
+    if settings.SOFT_DELETE_PURGE_INTERVAL > 0:
+        tasks.append(asyncio.create_task(run_purge_task()))
+    if settings.INVENTORY_SWEEP_INTERVAL > 0:
+        tasks.append(asyncio.create_task(run_sweeper_task()))
+    yield
+    for task in tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
 class EcommerceApp:
     def __init__(self) -> None:
         self.app = FastAPI(
@@ -17,6 +41,8 @@ class EcommerceApp:
             openapi_url="/api/openapi.json" if settings.DEBUG else None,
             docs_url="/api/docs" if settings.DEBUG else None,
             redoc_url="/api/redoc" if settings.DEBUG else None,
+            default_response_class=FastJSONResponse,
+            lifespan=lifespan,
         )
         self.validation_error_handler()
 
@@ -27,19 +53,25 @@ class EcommerceApp:
         )
 
     def make_middleware(self) -> None:
-        self.app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
-            allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-            allow_headers=["Content-Type", "Authorization"],
-        )
+        if settings.CORS_ORIGINS:
+            self.app.add_middleware(
+                CORSMiddleware,
+                allow_origins=settings.CORS_ORIGINS,
+                allow_credentials=True,
+                allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+                allow_headers=["Content-Type", "Authorization"],
+            )
         self.app.add_middleware(CustomErrorMiddleware)
+        # Always on: Server-Timing, N+1 detection and the histograms behind the metrics route
+        self.app.add_middleware(InstrumentationMiddleware)
 
     def init_routers(self) -> None:
-        pass
+        if settings.INTERNAL_METRICS_ENABLED:
+            self.app.include_router(metrics_router)
+        self.app.include_router(catalog_router, prefix="/api/v1")
 
     def create_app(self) -> FastAPI:
+        self.make_middleware()
         self.init_routers()
         return self.app
 
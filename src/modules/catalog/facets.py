@@ -0,0 +1,117 @@
+"""Facet counts for product listings.
+
+Counts for a whole category come from ``catalog_facet_counts``, which statement-level
+triggers on ``catalog_products`` keep current: each ``INSERT``/``UPDATE``/``DELETE``
+(including ``COPY`` and bulk repository writes) turns its transition tables into one
+``+1``/``-1`` delta per category and facet value and applies them with a single upsert.
+Any other filter set is counted live, all facets in one ``GROUPING SETS`` pass.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import DDL, Integer, event, func, literal_column, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from .models import FacetCount, Product
+
+# Upper bounds of the price facet buckets; bucket 0 is below the first bound and bucket
+# len(PRICE_BUCKETS) is at or above the last one
+PRICE_BUCKETS: tuple[Decimal, ...] = tuple(
+    Decimal(bound) for bound in (25, 50, 100, 250, 500, 1000)
+)
+FACETS = ("brand", "category", "price")
+
+_BOUNDS_SQL = "ARRAY[{}]::numeric[]".format(", ".join(str(bound) for bound in PRICE_BUCKETS))
+
+
+def price_bucket(price: Any) -> ColumnElement[int]:
+    """SQL expression of the price facet bucket of ``price``."""
+    return func.width_bucket(price, literal_column(_BOUNDS_SQL), type_=Integer)
+
+
+def bucket_range(bucket: int) -> tuple[Decimal | None, Decimal | None]:
+    """Inclusive lower and exclusive upper price of ``bucket``; ``None`` is unbounded."""
+    lower = PRICE_BUCKETS[bucket - 1] if bucket > 0 else None
+    upper = PRICE_BUCKETS[bucket] if bucket < len(PRICE_BUCKETS) else None
+    return lower, upper
+
+
+def _deltas_sql(source: str, sign: int) -> str:
+    return (
+        f"SELECT category_id, brand_id, price, {sign} AS delta FROM {source} "
+        "WHERE is_active AND deleted_at IS NULL"
+    )
+
+
+def _apply_sql(changes: str) -> str:
+    # Rows are upserted in key order so concurrent writers lock them in the same order
+    return f"""
+        INSERT INTO {FacetCount.__tablename__} AS summary (category_id, facet, value, product_count)
+        SELECT changes.category_id, facet.name, facet.value, sum(changes.delta)
+        FROM ({changes}) AS changes
+        CROSS JOIN LATERAL (VALUES
+            ('brand', changes.brand_id),
+            ('category', changes.category_id),
+            ('price', width_bucket(changes.price, {_BOUNDS_SQL}))
+        ) AS facet (name, value)
+        WHERE facet.value IS NOT NULL
+        GROUP BY 1, 2, 3
+        HAVING sum(changes.delta) <> 0
+        ORDER BY 1, 2, 3
+        ON CONFLICT (category_id, facet, value) DO UPDATE
+        SET product_count = summary.product_count + EXCLUDED.product_count,
+            updated_at = now();
+    """
+
+
+_FUNCTION = "catalog_products_facet_counts"
+_PRODUCTS = Product.__tablename__
+
+FACET_TRIGGER_DDL = [
+    f"""
+    CREATE OR REPLACE FUNCTION {_FUNCTION}() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            {_apply_sql(_deltas_sql("new_rows", 1))}
+        ELSIF TG_OP = 'DELETE' THEN
+            {_apply_sql(_deltas_sql("old_rows", -1))}
+        ELSE
+            {_apply_sql(f"{_deltas_sql('new_rows', 1)} UNION ALL {_deltas_sql('old_rows', -1)}")}
+        END IF;
+        RETURN NULL;
+    END $$
+    """,
+    # A trigger with transition tables may only fire on one kind of event
+    f"""
+    CREATE TRIGGER {_PRODUCTS}_facets_insert AFTER INSERT ON {_PRODUCTS}
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION {_FUNCTION}()
+    """,
+    f"""
+    CREATE TRIGGER {_PRODUCTS}_facets_update AFTER UPDATE ON {_PRODUCTS}
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION {_FUNCTION}()
+    """,
+    f"""
+    CREATE TRIGGER {_PRODUCTS}_facets_delete AFTER DELETE ON {_PRODUCTS}
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION {_FUNCTION}()
+    """,
+]
+
+for _statement in FACET_TRIGGER_DDL:
+    event.listen(
+        Product.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql")
+    )
+
+
+async def rebuild_facet_counts(session: AsyncSession) -> None:
+    """Recount ``catalog_facet_counts`` from scratch, e.g. after a restore or ``TRUNCATE``.
+
+    The table is locked against product writes meanwhile, so no trigger delta is lost
+    between the delete and the recount.
+    """
+    await session.execute(text(f"LOCK TABLE {_PRODUCTS} IN SHARE MODE"))
+    await session.execute(text(f"DELETE FROM {FacetCount.__tablename__}"))
+    await session.execute(text(_apply_sql(_deltas_sql(_PRODUCTS, 1))))
+    await session.commit()
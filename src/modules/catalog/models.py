@@ -0,0 +1,64 @@
+from decimal import Decimal
+
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, Numeric, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from src.core.models import BaseModel, SoftDeleteMixin
+from src.core.repository.search import PostgresFullTextSearch
+
+
+class Brand(BaseModel):
+    __tablename__ = "catalog_brands"
+
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    slug: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+
+
+class Category(BaseModel):
+    __tablename__ = "catalog_categories"
+
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    slug: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    parent_id: Mapped[int | None] = mapped_column(ForeignKey("catalog_categories.id"))
+
+
+class Product(SoftDeleteMixin, BaseModel):
+    __tablename__ = "catalog_products"
+    __search_backend__ = PostgresFullTextSearch(("name", "description"), config="english")
+    __table_args__ = (
+        # Storefront listings filter on live, active products of one category
+        Index(
+            "ix_catalog_products_listing",
+            "category_id",
+            "price",
+            postgresql_where="is_active AND deleted_at IS NULL",
+        ),
+    )
+
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
+    sku: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    description: Mapped[str | None] = mapped_column(Text)
+    price: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    brand_id: Mapped[int | None] = mapped_column(ForeignKey("catalog_brands.id"), index=True)
+    category_id: Mapped[int] = mapped_column(
+        ForeignKey("catalog_categories.id"), index=True, nullable=False
+    )
+
+    brand: Mapped[Brand | None] = relationship()
+    category: Mapped[Category] = relationship()
+
+
+class FacetCount(BaseModel):
+    """Live, active products per category and facet value, maintained by triggers.
+
+    See :mod:`src.modules.catalog.facets` for the triggers and the full rebuild.
+    """
+
+    __tablename__ = "catalog_facet_counts"
+    __table_args__ = (UniqueConstraint("category_id", "facet", "value"),)
+
+    category_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # "brand", "category" or "price"; price values are bucket numbers from PRICE_BUCKETS
+    facet: Mapped[str] = mapped_column(String(20), nullable=False)
+    value: Mapped[int] = mapped_column(Integer, nullable=False)
+    product_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
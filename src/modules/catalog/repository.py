@@ -0,0 +1,106 @@
+from typing import Any, cast
+
+from sqlalchemy import Select, bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.repository.base import BaseRepository, WhereShape
+from src.core.schemas.common import FilterOptions
+
+from .facets import FACETS, price_bucket
+from .models import FacetCount, Product
+
+# Filters a FacetCount row already accounts for; everything else is counted live
+_SUMMARY_FILTERS = {("is_active", "exact", "value"), ("deleted_at", "isnull", True)}
+
+
+class ProductRepository(BaseRepository[Product]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(Product, session)
+
+    def _facet_columns(self) -> dict[str, Any]:
+        return {
+            "brand": Product.brand_id,
+            "category": Product.category_id,
+            "price": price_bucket(Product.price),
+        }
+
+    def _summary_category(
+        self, where_shape: WhereShape, params: dict[str, Any]
+    ) -> tuple[bool, Any]:
+        """Whether the summary table can answer ``where_shape``, and for which category.
+
+        It holds counts of live, active products per category, so only a filter set of
+        ``is_active=True`` and at most one exact ``category_id`` qualifies.
+        """
+        filter_shape, or_shape, search_shape = where_shape
+        if or_shape or search_shape:
+            return False, None
+        category_id = None
+        matched = set()
+        for index, entry in enumerate(filter_shape):
+            if entry == ("category_id", "exact", "value"):
+                category_id = params[f"f{index}"]
+            elif entry in _SUMMARY_FILTERS and (entry[0] != "is_active" or params[f"f{index}"]):
+                matched.add(entry)
+            else:
+                return False, None
+        return matched == _SUMMARY_FILTERS, category_id
+
+    def _build_facet_query(self, where_shape: WhereShape) -> Select[Any]:
+        """Count every facet of the rows matching ``where_shape`` in one ``GROUPING SETS`` scan.
+
+        ``GROUPING(column)`` is 0 in the rows grouped by that column, which tells a
+        ``NULL`` brand apart from the rows of the other grouping sets.
+        """
+        columns = self._facet_columns()
+        query = select(
+            *(column.label(name) for name, column in columns.items()),
+            *(func.grouping(column).label(f"{name}_grouping") for name, column in columns.items()),
+            func.count().label("count"),
+        ).group_by(func.grouping_sets(*columns.values()))
+        condition = self._build_where(where_shape)
+        if condition is not None:
+            query = query.where(condition)
+        return query
+
+    def _build_summary_query(self, has_category: bool) -> Select[Any]:
+        total = func.sum(FacetCount.product_count)
+        query = (
+            select(FacetCount.facet, FacetCount.value, total.label("count"))
+            .group_by(FacetCount.facet, FacetCount.value)
+            .having(total > 0)
+        )
+        if has_category:
+            query = query.where(FacetCount.category_id == bindparam("category_id"))
+        # The row type of a three-column select differs between SQLAlchemy 2.0 and 2.1 stubs
+        return cast(Select[Any], query)
+
+    async def facets(self, filter_options: FilterOptions) -> dict[str, dict[int, int]]:
+        """Product counts per brand, category and price bucket for ``filter_options``.
+
+        The WHERE clause is compiled from ``filter_options`` exactly as for
+        ``paginate_filters``, so counts always describe the listed products. Whole-category
+        listings read the trigger-maintained summary table instead of scanning products.
+        """
+        where_shape, params = self._where_params(filter_options, search=True)
+        counts: dict[str, dict[int, int]] = {name: {} for name in FACETS}
+
+        use_summary, category_id = self._summary_category(where_shape, params)
+        if use_summary:
+            has_category = category_id is not None
+            query = self._cached(
+                ("facet_summary", has_category), lambda: self._build_summary_query(has_category)
+            )
+            result = await self.session.execute(
+                query, {"category_id": category_id} if has_category else {}
+            )
+            for facet, value, count in result:
+                counts[facet][value] = int(count)
+            return counts
+
+        query = self._cached(("facets", where_shape), lambda: self._build_facet_query(where_shape))
+        for row in (await self.session.execute(query, params)).mappings():
+            for name in FACETS:
+                # Products without a brand have no value to filter by, as in the summary
+                if row[f"{name}_grouping"] == 0 and row[name] is not None:
+                    counts[name][row[name]] = row["count"]
+        return counts
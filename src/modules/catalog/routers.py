@@ -0,0 +1,84 @@
+from decimal import Decimal
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.db import get_db
+from src.core.helpers.serialization import json_response, paginated_response, partial_schema
+from src.core.schemas.common import PaginatedResponse, QueryParams
+from src.modules.catalog.schemas import ProductFacets, ProductFilterParams, ProductSchema
+from src.modules.catalog.services.product import ProductService
+
+router = APIRouter(prefix="/catalog", tags=["catalog"])
+
+
+def get_product_service(session: Annotated[AsyncSession, Depends(get_db)]) -> ProductService:
+    return ProductService(session)
+
+
+def product_query(
+    page: Annotated[int, Query(ge=1)] = 1,
+    page_size: Annotated[int, Query(ge=1, le=100)] = 20,
+    search: str | None = None,
+    sort: Annotated[str | None, Query(description="Sort field, prefixed by - for desc")] = None,
+    after: str | None = None,
+    before: str | None = None,
+    fields: str | None = None,
+) -> QueryParams:
+    sorting = None
+    if sort:
+        sorting = {sort.removeprefix("-"): "desc" if sort.startswith("-") else "asc"}
+    return QueryParams(
+        page=page,
+        page_size=page_size,
+        search=search,
+        sorting=sorting,
+        after=after,
+        before=before,
+        fields=fields,
+    )
+
+
+def product_filters(
+    brand_id: Annotated[list[int] | None, Query()] = None,
+    category_id: int | None = None,
+    min_price: Annotated[Decimal | None, Query(ge=0)] = None,
+    max_price: Annotated[Decimal | None, Query(ge=0)] = None,
+) -> ProductFilterParams:
+    return ProductFilterParams(
+        brand_id=brand_id, category_id=category_id, min_price=min_price, max_price=max_price
+    )
+
+
+@router.get("/products", response_model=PaginatedResponse[ProductSchema])
+async def list_products(
+    params: Annotated[QueryParams, Depends(product_query)],
+    filters: Annotated[ProductFilterParams, Depends(product_filters)],
+    service: Annotated[ProductService, Depends(get_product_service)],
+) -> Response:
+    """List products; ``meta.extra`` carries the facet counts of the same filters.
+
+    ``fields`` narrows each product to the listed fields and ``id``.
+    """
+    schema = partial_schema(ProductSchema, params.field_set)
+    rows, meta = await service.list_products(params, filters)
+    return paginated_response(rows, meta, schema)
+
+
+@router.get("/products/facets", response_model=ProductFacets)
+async def product_facets(
+    params: Annotated[QueryParams, Depends(product_query)],
+    filters: Annotated[ProductFilterParams, Depends(product_filters)],
+    service: Annotated[ProductService, Depends(get_product_service)],
+) -> Response:
+    facets = await service.facets(service.filter_options(params, filters))
+    return json_response(facets, ProductFacets)
+
+
+@router.get("/products/{product_id}", response_model=ProductSchema)
+async def get_product(
+    product_id: int,
+    service: Annotated[ProductService, Depends(get_product_service)],
+) -> Response:
+    return json_response(await service.get_product(product_id), ProductSchema)
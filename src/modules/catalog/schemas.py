@@ -0,0 +1,55 @@
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BrandSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    slug: str
+
+
+class CategorySchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    slug: str
+    parent_id: int | None = None
+
+
+class ProductSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    sku: str
+    description: str | None = None
+    price: Decimal
+    brand_id: int | None = None
+    category_id: int
+
+
+class ProductFilterParams(BaseModel):
+    brand_id: list[int] | None = Field(None, description="Brands to include")
+    category_id: int | None = Field(None, description="Category to list")
+    min_price: Decimal | None = Field(None, ge=0)
+    max_price: Decimal | None = Field(None, ge=0)
+
+
+class FacetValue(BaseModel):
+    value: int
+    count: int
+
+
+class PriceFacetValue(FacetValue):
+    min_price: Decimal | None = None
+    max_price: Decimal | None = None
+
+
+class ProductFacets(BaseModel):
+    brand: list[FacetValue]
+    category: list[FacetValue]
+    price: list[PriceFacetValue]
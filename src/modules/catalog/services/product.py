@@ -0,0 +1,78 @@
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.error.exceptions import NotFoundException
+from src.core.schemas.common import FilterOptions, PaginationMeta, QueryParams
+from src.modules.catalog.facets import bucket_range
+from src.modules.catalog.models import Product
+from src.modules.catalog.repository import ProductRepository
+from src.modules.catalog.schemas import (
+    FacetValue,
+    PriceFacetValue,
+    ProductFacets,
+    ProductFilterParams,
+)
+
+
+class ProductService:
+    def __init__(self, session: AsyncSession) -> None:
+        self.repository = ProductRepository(session)
+
+    def filter_options(self, params: QueryParams, filters: ProductFilterParams) -> FilterOptions:
+        """Storefront filter set: live, active products narrowed by ``filters``."""
+        conditions: dict[str, Any] = {"is_active": True}
+        if filters.category_id is not None:
+            conditions["category_id"] = filters.category_id
+        if filters.brand_id:
+            conditions["brand_id__in"] = filters.brand_id
+        if filters.min_price is not None:
+            conditions["price__ge"] = filters.min_price
+        if filters.max_price is not None:
+            conditions["price__le"] = filters.max_price
+        sorting = params.sorting
+        if sorting is None and not params.search:
+            sorting = {"id": "asc"}
+        return FilterOptions(
+            filters=conditions,
+            pagination=params,
+            # Without an explicit sort, searches are ordered by relevance
+            sorting=sorting,
+            projection=params.field_set,
+            search_fields=["name", "description"],
+        )
+
+    async def facets(self, filter_options: FilterOptions) -> ProductFacets:
+        counts = await self.repository.facets(filter_options)
+        return ProductFacets(
+            brand=[
+                FacetValue(value=value, count=count) for value, count in counts["brand"].items()
+            ],
+            category=[
+                FacetValue(value=value, count=count) for value, count in counts["category"].items()
+            ],
+            price=[
+                PriceFacetValue(
+                    value=bucket,
+                    count=count,
+                    min_price=bucket_range(bucket)[0],
+                    max_price=bucket_range(bucket)[1],
+                )
+                for bucket, count in sorted(counts["price"].items())
+            ],
+        )
+
+    async def list_products(
+        self, params: QueryParams, filters: ProductFilterParams
+    ) -> tuple[Sequence[Product], PaginationMeta]:
+        """One page of products, with the facet counts of the same filter set in ``meta.extra``."""
+        filter_options = self.filter_options(params, filters)
+        rows, meta = await self.repository.paginate_filters(filter_options)
+        meta.extra = await self.facets(filter_options)
+        return rows, meta  # type: ignore[return-value]
+
+    async def get_product(self, product_id: int) -> Product:
+        product = await self.repository.get_by_id(product_id, FilterOptions(filters={}))
+        if product is None or not product.is_active:  # type: ignore[union-attr]
+            raise NotFoundException(message="Product not found")
+        return product  # type: ignore[return-value]
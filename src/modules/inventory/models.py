@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.core.models import BaseModel
+from src.modules.catalog.models import Product
+
+HELD = "held"
+COMMITTED = "committed"
+RELEASED = "released"
+EXPIRED = "expired"
+
+
+class StockLevel(BaseModel):
+    """Stock of one product: ``available`` can be reserved, ``reserved`` is on hold."""
+
+    __tablename__ = "inventory_stock_levels"
+    __table_args__ = (
+        CheckConstraint("available >= 0", name="ck_inventory_stock_levels_available"),
+        CheckConstraint("reserved >= 0", name="ck_inventory_stock_levels_reserved"),
+    )
+
+    product_id: Mapped[int] = mapped_column(ForeignKey(Product.id), unique=True, nullable=False)
+    available: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    reserved: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class Reservation(BaseModel):
+    """A time-limited hold of ``quantity`` units for ``reference``, e.g. a cart or order."""
+
+    __tablename__ = "inventory_reservations"
+    __table_args__ = (
+        CheckConstraint("quantity > 0", name="ck_inventory_reservations_quantity"),
+        # The sweeper only ever scans live holds by expiry
+        Index(
+            "ix_inventory_reservations_held_expiry",
+            "expires_at",
+            postgresql_where=f"status = '{HELD}'",
+        ),
+    )
+
+    reference: Mapped[str] = mapped_column(String(64), index=True, nullable=False)
+    product_id: Mapped[int] = mapped_column(ForeignKey(Product.id), nullable=False)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default=HELD)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,131 @@
+from collections import Counter
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Table, bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.repository.base import BaseRepository
+
+from .models import HELD, Reservation, StockLevel
+
+# Conditional UPDATEs bypass ORM state; the identity map is refreshed by RETURNING instead
+NO_SYNC = {"synchronize_session": False}
+
+
+class StockRepository(BaseRepository[StockLevel]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(StockLevel, session)
+
+    async def take(self, product_id: int, quantity: int) -> bool:
+        """Move ``quantity`` units from available to reserved if that many are available.
+
+        A single ``UPDATE ... WHERE available >= :quantity``: the row lock it takes makes
+        concurrent takes queue up and re-check the condition, so stock can never go
+        negative and no read-modify-write race exists.
+        """
+        statement = self._cached(
+            ("take",),
+            lambda: (
+                update(StockLevel)
+                .where(
+                    StockLevel.product_id == bindparam("p_id"),
+                    StockLevel.available >= bindparam("quantity"),
+                )
+                .values(
+                    available=StockLevel.available - bindparam("quantity"),
+                    reserved=StockLevel.reserved + bindparam("quantity"),
+                )
+                .returning(StockLevel.id)
+            ),
+        )
+        params = {"p_id": product_id, "quantity": quantity}
+        stock_id = await self.session.scalar(statement, params, execution_options=NO_SYNC)
+        if stock_id is None:
+            return False
+        await self._commit()
+        await self._invalidate([stock_id])
+        return True
+
+    async def settle(self, quantities: dict[int, int], sold: bool) -> None:
+        """Take released or sold units off ``reserved``; released ones become available again.
+
+        Products are updated in id order, the same order ``take`` locks them in through
+        ``InventoryService.reserve``, so settling never deadlocks against reserving.
+        """
+        if not quantities:
+            return
+        table: Table = StockLevel.__table__  # type: ignore[assignment]
+        statement = (
+            update(table)
+            .where(table.c.product_id == bindparam("p_id"))
+            .values(
+                reserved=table.c.reserved - bindparam("qty"),
+                available=table.c.available + (0 if sold else bindparam("qty")),
+                updated_at=func.now(),
+            )
+        )
+        await self.session.execute(
+            statement,
+            [
+                {"p_id": product_id, "qty": quantities[product_id]}
+                for product_id in sorted(quantities)
+            ],
+        )
+        await self._commit()
+        await self._invalidate()
+
+
+def _quantities(rows: Sequence[Any]) -> dict[int, int]:
+    totals: Counter[int] = Counter()
+    for product_id, quantity in rows:
+        totals[product_id] += quantity
+    return dict(totals)
+
+
+class ReservationRepository(BaseRepository[Reservation]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(Reservation, session)
+
+    async def finish(self, reference: str, status: str, live_only: bool) -> dict[int, int]:
+        """Move the held reservations of ``reference`` to ``status``.
+
+        With ``live_only`` holds past their expiry are left for the sweeper. Returns the
+        reserved quantity per product, empty when nothing was held.
+        """
+        statement = (
+            update(Reservation)
+            .where(Reservation.reference == reference, Reservation.status == HELD)
+            .values(status=status)
+            .returning(Reservation.product_id, Reservation.quantity)
+        )
+        if live_only:
+            statement = statement.where(Reservation.expires_at > func.now())
+        rows = (await self.session.execute(statement, execution_options=NO_SYNC)).all()
+        await self._commit()
+        await self._invalidate()
+        return _quantities(rows)
+
+    async def claim_expired(self, status: str, limit: int) -> dict[int, int]:
+        """Move up to ``limit`` expired holds to ``status``, skipping rows locked elsewhere.
+
+        ``FOR UPDATE SKIP LOCKED`` lets several sweepers, and checkouts confirming a hold
+        right at its expiry, work side by side: each claims rows no one else holds instead
+        of waiting on them.
+        """
+        expired = (
+            select(Reservation.id)
+            .where(Reservation.status == HELD, Reservation.expires_at <= func.now())
+            .order_by(Reservation.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(Reservation)
+            .where(Reservation.id.in_(expired))
+            .values(status=status)
+            .returning(Reservation.product_id, Reservation.quantity)
+        )
+        rows = (await self.session.execute(statement, execution_options=NO_SYNC)).all()
+        await self._commit()
+        await self._invalidate()
+        return _quantities(rows)
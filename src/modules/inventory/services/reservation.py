@@ -0,0 +1,96 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.config import settings
+from src.core.db import uow
+from src.core.error.codes import INVALID_QUERY
+from src.core.error.exceptions import (
+    OutOfStockException,
+    ReservationExpiredException,
+    ValidationException,
+)
+from src.modules.inventory.models import COMMITTED, EXPIRED, HELD, RELEASED, Reservation
+from src.modules.inventory.repository import ReservationRepository, StockRepository
+
+
+class InventoryService:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.stock = StockRepository(session)
+        self.reservations = ReservationRepository(session)
+
+    async def reserve(
+        self,
+        reference: str,
+        items: dict[int, int],
+        hold_seconds: int | None = None,
+    ) -> list[Reservation]:
+        """Hold ``items`` (product id -> quantity) for ``reference``, all or nothing.
+
+        Raises:
+            ValidationException: A quantity is not positive.
+            OutOfStockException: A product has fewer units available than requested.
+        """
+        invalid = {
+            str(product_id): "Quantity must be positive"
+            for product_id, quantity in items.items()
+            if quantity <= 0
+        }
+        if invalid:
+            raise ValidationException(errors=invalid, error_code=INVALID_QUERY)
+
+        hold = timedelta(seconds=hold_seconds or settings.INVENTORY_HOLD_SECONDS)
+        async with uow(self.session):
+            # Locking stock rows in id order keeps concurrent multi-item carts deadlock-free
+            for product_id in sorted(items):
+                if not await self.stock.take(product_id, items[product_id]):
+                    raise OutOfStockException(errors={str(product_id): "Not enough stock"})
+            expires_at = datetime.now(UTC) + hold
+            return await self.reservations.create_many(
+                [
+                    {
+                        "reference": reference,
+                        "product_id": product_id,
+                        "quantity": quantity,
+                        "status": HELD,
+                        "expires_at": expires_at,
+                    }
+                    for product_id, quantity in sorted(items.items())
+                ]
+            )
+
+    async def confirm(self, reference: str) -> dict[int, int]:
+        """Turn the live holds of ``reference`` into sales, e.g. once payment succeeded.
+
+        Raises:
+            ReservationExpiredException: Nothing is held for ``reference`` any more.
+        """
+        async with uow(self.session):
+            quantities = await self.reservations.finish(reference, COMMITTED, live_only=True)
+            if not quantities:
+                raise ReservationExpiredException()
+            await self.stock.settle(quantities, sold=True)
+        return quantities
+
+    async def release(self, reference: str) -> dict[int, int]:
+        """Give the held units of ``reference`` back to available stock."""
+        async with uow(self.session):
+            quantities = await self.reservations.finish(reference, RELEASED, live_only=False)
+            await self.stock.settle(quantities, sold=False)
+        return quantities
+
+    async def sweep_expired(self, batch_size: int | None = None) -> int:
+        """Release every expired hold, ``batch_size`` holds per transaction.
+
+        Returns:
+            int: Units returned to available stock.
+        """
+        batch_size = batch_size or settings.INVENTORY_SWEEP_BATCH
+        released = 0
+        while True:
+            async with uow(self.session):
+                quantities = await self.reservations.claim_expired(EXPIRED, batch_size)
+                await self.stock.settle(quantities, sold=False)
+            released += sum(quantities.values())
+            if not quantities:
+                return released
@@ -0,0 +1,21 @@
+import asyncio
+
+from src.core.config import settings
+from src.core.db.connection import async_session
+from src.core.logger import logger
+from src.modules.inventory.services.reservation import InventoryService
+
+
+async def run_sweeper_task(interval: float | None = None) -> None:
+    """Release expired holds every ``interval`` seconds (``INVENTORY_SWEEP_INTERVAL``)."""
+    interval = interval or settings.INVENTORY_SWEEP_INTERVAL
+    while True:
+        try:
+            async with async_session() as session:
+                released = await InventoryService(session).sweep_expired()
+        except Exception:
+            logger.exception("Releasing expired inventory holds failed")
+        else:
+            if released:
+                logger.info("Released %d units from expired inventory holds", released)
+        await asyncio.sleep(interval)
@@ -0,0 +1,48 @@
+"""Background job worker, run next to the API process.
+
+Usage:
+    python -m src.worker
+    python -m src.worker --queue default=8 --queue emails=2
+"""
+
+import argparse
+import asyncio
+import importlib
+import signal
+
+from src.core.config import settings
+from src.core.db.connection import engine
+from src.core.jobs import Worker
+
+
+def parse_queue(value: str) -> tuple[str, int]:
+    name, _, concurrency = value.partition("=")
+    try:
+        return name, int(concurrency or 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME=CONCURRENCY, got {value!r}") from None
+
+
+async def main(queues: dict[str, int] | None) -> None:
+    for module in settings.JOB_MODULES:
+        importlib.import_module(module)
+    worker = Worker(queues)
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--queue",
+        action="append",
+        type=parse_queue,
+        help="Queue to work on with its concurrency, e.g. emails=2; defaults to JOB_QUEUES",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(dict(args.queue) if args.queue else None))